@@ -0,0 +1,52 @@
+"""
+Per-request write buffering for ingestion endpoints.
+
+Routes that accept many records but don't need their generated IDs back
+can queue rows on a BulkBuffer instead of inserting them one by one. The
+buffer is flushed with a single INSERT when the request finishes.
+"""
+from typing import Any, AsyncGenerator, Dict, List
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, schemas
+from app.database import get_db
+from app.exceptions import PatientNotFoundError
+
+
+class BulkBuffer:
+    """Rows queued during a request, written together at request end."""
+    
+    def __init__(self):
+        self.call_history_rows: List[Dict[str, Any]] = []
+    
+    def add_call_history(self, payload: schemas.CallHistoryCreate) -> None:
+        """Queue a call history record for insertion."""
+        self.call_history_rows.append(payload.model_dump())
+
+
+async def get_bulk_buffer(
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+) -> AsyncGenerator[BulkBuffer, None]:
+    """
+    Dependency that provides a BulkBuffer and flushes it after the route.
+    
+    The buffer is also stored on request.state.bulk_buffer. Rows are only
+    written if the route completes without raising; the flush happens
+    before the response is sent, so write errors still reach the client.
+    
+    Raises:
+        HTTPException: 404 if a buffered row references a missing patient
+    """
+    buffer = BulkBuffer()
+    request.state.bulk_buffer = buffer
+    yield buffer
+    
+    try:
+        await crud.insert_call_history_rows(db, buffer.call_history_rows)
+    except PatientNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
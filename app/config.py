@@ -5,6 +5,7 @@ Configuration is loaded from environment variables with support for
 default values and .env file loading.
 """
 import os
+from functools import cached_property
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List, Optional
 
@@ -21,6 +22,7 @@ class Settings(BaseSettings):
     app_version: str = "1.0.0"
     debug: bool = False
     log_level: str = "INFO"
+    docs_enabled: bool = True
     
     postgres_user: Optional[str] = None
     postgres_password: Optional[str] = None
@@ -28,19 +30,31 @@ class Settings(BaseSettings):
     postgres_host: Optional[str] = None
     postgres_port: Optional[int] = None
     
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_recycle: int = 3600
+    db_pool_timeout: int = 30
+    db_statement_cache_size: int = 100
+    
+    medical_condition_cache_ttl: int = 300
+    
     api_v1_prefix: str = "/api/v1"
     cors_origins: List[str] = ["http://localhost:3000", "http://localhost:8000"]
     
-    @property
+    @cached_property
     def get_database_url(self) -> str:
-        """Construct database URL from POSTGRES_* variables."""
+        """
+        Construct database URL from POSTGRES_* variables.
+        
+        Computed on first access and cached on the settings instance.
+        """
         user = self.postgres_user or os.getenv("POSTGRES_USER", "mytomorrows")
         password = self.postgres_password or os.getenv("POSTGRES_PASSWORD", "mytomorrows123")
         host = self.postgres_host or os.getenv("POSTGRES_HOST", "localhost")
         port = self.postgres_port or int(os.getenv("POSTGRES_PORT", "5432"))
         db = self.postgres_db or os.getenv("POSTGRES_DB", "mytomorrows_db")
         
-        return f"postgresql://{user}:{password}@{host}:{port}/{db}"
+        return f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db}"
 
 
 settings = Settings()
@@ -1,11 +1,18 @@
 """
 CRUD operations for database models.
 """
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, Table, any_, bindparam, exists, func, insert, lambda_stmt, select, true, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID, insert as pg_insert
+from sqlalchemy.sql import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, joinedload, selectinload
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
-from typing import Optional, List, Tuple
+from typing import Any, Dict, Optional, List, Set, Tuple
 from uuid import UUID
+from cachetools import TTLCache
 from app import models, schemas
+from app.config import settings
+from app.ids import uuid7
 from app.exceptions import (
     PatientNotFoundError,
     PersonNotFoundError,
@@ -15,33 +22,171 @@ from app.exceptions import (
 )
 from app.logger import logger
 
+# Relationships serialized by PatientResponse. Model relationships raise
+# instead of lazy loading, so every query returning patients must use one
+# of these. Both are many-to-one, so SELECTs join them in; DML RETURNING
+# can't carry joins and loads them with one extra SELECT each instead.
+_PATIENT_RELATIONSHIPS = (
+    joinedload(models.Patient.person),
+    joinedload(models.Patient.medical_condition),
+)
+_PATIENT_RETURNING_RELATIONSHIPS = (
+    selectinload(models.Patient.person),
+    selectinload(models.Patient.medical_condition),
+)
+
+# IDs of medical conditions known to exist. The table is a small,
+# rarely-changing lookup and the API only soft-deletes conditions, so FK
+# validation on patient creation can skip the database for
+# medical_condition_cache_ttl seconds. Misses are never cached; anything
+# that deletes condition rows outside the API must clear this cache.
+_medical_condition_cache: TTLCache = TTLCache(maxsize=1024, ttl=settings.medical_condition_cache_ttl)
+
+
+async def _insert_returning(
+    db: AsyncSession,
+    model: Any,
+    data: Dict[str, Any],
+    options: Tuple[Any, ...] = ()
+) -> Any:
+    """
+    Insert a row and return the ORM instance built from INSERT ... RETURNING.
+    
+    Server-generated columns (timestamps, defaults) come back with the
+    INSERT itself, so no follow-up SELECT is needed to populate them.
+    """
+    stmt = insert(model).values(**data).returning(model).options(*options)
+    return (await db.execute(stmt)).scalar_one()
+
+
+async def _core_insert_returning(db: AsyncSession, table: Table, data: Dict[str, Any]) -> Row:
+    """
+    Insert a row with a Core INSERT ... RETURNING and return the plain row.
+    
+    Skips ORM instance construction and identity-map bookkeeping for
+    append-only writes whose result is only serialized. The returned Row
+    exposes columns as attributes, like a model instance.
+    """
+    return (await db.execute(insert(table).values(**data).returning(*table.c))).one()
 
-def get_person(db: Session, person_id: UUID) -> Optional[models.Person]:
-    """Get a person by ID."""
-    return db.query(models.Person).filter(models.Person.person_id == person_id).first()
 
+async def _bulk_insert_returning(
+    db: AsyncSession,
+    model: Any,
+    rows: List[Dict[str, Any]],
+    options: Tuple[Any, ...] = ()
+) -> List[Any]:
+    """
+    Insert many rows with a single parameterized INSERT ... RETURNING.
+    
+    Instances are returned in the same order as the input rows.
+    """
+    if not rows:
+        return []
+    stmt = insert(model).returning(model, sort_by_parameter_order=True).options(*options)
+    return list((await db.execute(stmt, rows)).scalars())
+
+
+async def _update_returning(
+    db: AsyncSession,
+    model: Any,
+    pk_column: Any,
+    pk_value: Any,
+    data: Dict[str, Any],
+    options: Tuple[Any, ...] = ()
+) -> Optional[Any]:
+    """
+    Update one row by primary key and return it via UPDATE ... RETURNING.
+    
+    Returns None if no row matched. Any instance already in the session is
+    refreshed from the returned row rather than re-selected.
+    """
+    stmt = (
+        update(model)
+        .where(pk_column == pk_value)
+        .values(**data)
+        .returning(model)
+        .options(*options)
+        .execution_options(populate_existing=True)
+    )
+    return (await db.execute(stmt)).scalar_one_or_none()
+
+
+async def _soft_delete(db: AsyncSession, table: Table, pk_column: Any, pk_value: Any) -> bool:
+    """
+    Set is_active=False on one row with a single UPDATE, without loading it.
+    
+    Returns True if the row exists. updated_at still advances through the
+    column's onupdate, so the deactivation time is recorded.
+    """
+    stmt = update(table).where(pk_column == pk_value).values(is_active=False).returning(pk_column)
+    return (await db.execute(stmt)).first() is not None
 
-def get_person_by_email(db: Session, email: str) -> Optional[models.Person]:
+
+def _set_fields(schema: Any) -> Dict[str, Any]:
+    """
+    Return only the fields explicitly set on a Pydantic update schema.
+    
+    Reads model_fields_set directly instead of running model_dump, which
+    walks and copies the whole model.
+    """
+    return {name: getattr(schema, name) for name in schema.model_fields_set}
+
+
+async def _paginate_with_total(
+    db: AsyncSession,
+    stmt: Select,
+    skip: int,
+    limit: int
+) -> Tuple[List[Any], int]:
+    """
+    Fetch one page of a single-entity SELECT together with the total count.
+    
+    The total is computed with COUNT(*) OVER () in the same query, so a page
+    and its total cost one round-trip. Only a page past the end (no rows
+    to carry the window value) falls back to a separate COUNT.
+    """
+    rows = (await db.execute(
+        stmt.add_columns(func.count().over().label("total")).offset(skip).limit(limit)
+    )).all()
+    if rows:
+        return [row[0] for row in rows], rows[0].total
+    if skip:
+        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
+        return [], (await db.execute(count_stmt)).scalar_one()
+    return [], 0
+
+
+async def get_person(db: AsyncSession, person_id: UUID) -> Optional[models.Person]:
+    """Get a person by ID, using the session identity map when possible."""
+    return await db.get(models.Person, person_id)
+
+
+async def get_person_by_email(db: AsyncSession, email: str) -> Optional[models.Person]:
     """Get a person by email."""
-    return db.query(models.Person).filter(models.Person.email == email).first()
+    result = await db.execute(
+        lambda_stmt(lambda: select(models.Person).where(models.Person.email == email))
+    )
+    return result.scalars().first()
 
 
-def get_persons(
-    db: Session, 
+async def get_persons(
+    db: AsyncSession, 
     skip: int = 0, 
     limit: int = 100,
     is_active: Optional[bool] = None
 ) -> List[models.Person]:
     """Get multiple persons with pagination."""
-    query = db.query(models.Person)
+    stmt = select(models.Person)
     
     if is_active is not None:
-        query = query.filter(models.Person.is_active == is_active)
+        stmt = stmt.where(models.Person.is_active == is_active)
     
-    return query.offset(skip).limit(limit).all()
+    result = await db.execute(stmt.offset(skip).limit(limit))
+    return list(result.scalars())
 
 
-def create_person(db: Session, person: schemas.PersonCreate) -> models.Person:
+async def create_person(db: AsyncSession, person: schemas.PersonCreate) -> models.Person:
     """
     Create a new person record.
     
@@ -56,110 +201,176 @@ def create_person(db: Session, person: schemas.PersonCreate) -> models.Person:
         DatabaseError: If database operation fails
     """
     try:
-        db_person = models.Person(
-            first_name=person.first_name,
-            last_name=person.last_name,
-            email=person.email,
-            phone=person.phone
-        )
-        db.add(db_person)
-        db.commit()
-        db.refresh(db_person)
-        logger.info(f"Created person {db_person.person_id} with email {person.email}")
+        db_person = await _insert_returning(db, models.Person, person.model_dump())
+        await db.commit()
+        logger.info("Created person %s with email %s", db_person.person_id, person.email)
         return db_person
     except IntegrityError as e:
-        db.rollback()
-        logger.error(f"Integrity error creating person: {e}")
+        await db.rollback()
+        logger.error("Integrity error creating person: %s", e)
         raise DatabaseError(f"Failed to create person: duplicate email or constraint violation", e)
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error creating person: {e}")
+        await db.rollback()
+        logger.error("Database error creating person: %s", e)
         raise DatabaseError(f"Database operation failed: {str(e)}", e)
 
 
-def update_person(
-    db: Session, 
+async def bulk_create_persons(
+    db: AsyncSession,
+    persons: List[schemas.PersonCreate]
+) -> List[models.Person]:
+    """
+    Create many person records in a single INSERT and commit once.
+    
+    Args:
+        db: Database session
+        persons: Person creation schemas
+        
+    Returns:
+        Created Person model instances, in input order
+        
+    Raises:
+        DatabaseError: If database operation fails
+    """
+    try:
+        db_persons = await _bulk_insert_returning(
+            db, models.Person, [person.model_dump() for person in persons]
+        )
+        await db.commit()
+        logger.info("Bulk created %s persons", len(db_persons))
+        return db_persons
+    except IntegrityError as e:
+        await db.rollback()
+        logger.error("Integrity error bulk creating persons: %s", e)
+        raise DatabaseError(f"Failed to create persons: duplicate email or constraint violation", e)
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error("Database error bulk creating persons: %s", e)
+        raise DatabaseError(f"Database operation failed: {str(e)}", e)
+
+
+async def update_person(
+    db: AsyncSession, 
     person_id: UUID, 
     person_update: schemas.PersonUpdate
 ) -> Optional[models.Person]:
     """Update a person."""
-    db_person = get_person(db, person_id)
-    if not db_person:
-        return None
-    
-    update_data = person_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_person, field, value)
+    update_data = _set_fields(person_update)
+    if not update_data:
+        return await get_person(db, person_id)
     
-    db.commit()
-    db.refresh(db_person)
+    db_person = await _update_returning(
+        db, models.Person, models.Person.person_id, person_id, update_data
+    )
+    await db.commit()
     return db_person
 
 
-def delete_person(db: Session, person_id: UUID) -> bool:
+async def delete_person(db: AsyncSession, person_id: UUID) -> bool:
     """Soft delete a person (set is_active=False)."""
-    db_person = get_person(db, person_id)
-    if not db_person:
-        return False
-    
-    db_person.is_active = False
-    db.commit()
-    return True
+    found = await _soft_delete(db, models.Person.__table__, models.Person.person_id, person_id)
+    await db.commit()
+    return found
 
 
-def get_medical_condition(
-    db: Session, 
+async def get_medical_condition(
+    db: AsyncSession, 
     medical_condition_id: UUID
 ) -> Optional[models.MedicalCondition]:
-    """Get a medical condition by ID."""
-    return db.query(models.MedicalCondition).filter(
-        models.MedicalCondition.medical_condition_id == medical_condition_id
-    ).first()
+    """Get a medical condition by ID, using the session identity map when possible."""
+    return await db.get(models.MedicalCondition, medical_condition_id)
 
 
-def get_medical_conditions(
-    db: Session,
-    skip: int = 0,
+async def _find_missing_medical_conditions(
+    db: AsyncSession,
+    medical_condition_ids: Set[UUID]
+) -> Set[UUID]:
+    """
+    Return the IDs among medical_condition_ids that don't exist.
+    
+    Cached conditions are answered from memory; the rest are looked up
+    with one query and cached if found.
+    """
+    missing = {mc_id for mc_id in medical_condition_ids if mc_id not in _medical_condition_cache}
+    if not missing:
+        return missing
+    
+    found = await db.execute(
+        select(models.MedicalCondition.medical_condition_id)
+        .where(models.MedicalCondition.medical_condition_id.in_(missing))
+    )
+    for mc_id in found.scalars():
+        _medical_condition_cache[mc_id] = True
+        missing.discard(mc_id)
+    return missing
+
+
+async def get_medical_conditions(
+    db: AsyncSession,
+    cursor: Optional[UUID] = None,
     limit: int = 100,
     is_active: Optional[bool] = None
 ) -> List[models.MedicalCondition]:
-    """Get multiple medical conditions."""
-    query = db.query(models.MedicalCondition)
+    """
+    Get a page of medical conditions ordered by (created_at, id).
+    
+    Uses keyset pagination: the page starts after the condition whose ID
+    is passed as cursor, so the cost doesn't grow with the page number
+    the way OFFSET does.
+    
+    Args:
+        db: Database session
+        cursor: ID of the last condition on the previous page
+        limit: Maximum number of conditions to return
+        is_active: Filter by active status
+        
+    Returns:
+        List of MedicalCondition model instances
+    """
+    condition = models.MedicalCondition
+    stmt = select(condition)
     
     if is_active is not None:
-        query = query.filter(models.MedicalCondition.is_active == is_active)
+        stmt = stmt.where(condition.is_active == is_active)
+    
+    if cursor is not None:
+        anchor = aliased(models.MedicalCondition)
+        stmt = stmt.where(
+            tuple_(condition.created_at, condition.medical_condition_id)
+            > select(anchor.created_at, anchor.medical_condition_id)
+            .where(anchor.medical_condition_id == cursor)
+            .scalar_subquery()
+        )
     
-    return query.offset(skip).limit(limit).all()
+    stmt = stmt.order_by(condition.created_at, condition.medical_condition_id).limit(limit)
+    result = await db.execute(stmt)
+    return list(result.scalars())
 
 
-def create_medical_condition(
-    db: Session,
+async def create_medical_condition(
+    db: AsyncSession,
     medical_condition: schemas.MedicalConditionCreate
-) -> models.MedicalCondition:
-    """Create a new medical condition."""
+) -> Row:
+    """Create a new medical condition and return the inserted row."""
     try:
-        db_condition = models.MedicalCondition(
-            name=medical_condition.name,
-            abbreviation=medical_condition.abbreviation,
-            description=medical_condition.description
+        db_condition = await _core_insert_returning(
+            db, models.MedicalCondition.__table__, medical_condition.model_dump()
         )
-        db.add(db_condition)
-        db.commit()
-        db.refresh(db_condition)
-        logger.info(f"Created medical condition {db_condition.medical_condition_id}")
+        await db.commit()
+        logger.info("Created medical condition %s", db_condition.medical_condition_id)
         return db_condition
     except IntegrityError as e:
-        db.rollback()
-        logger.error(f"Integrity error creating medical condition: {e}")
+        await db.rollback()
+        logger.error("Integrity error creating medical condition: %s", e)
         raise DatabaseError(f"Failed to create medical condition: duplicate name or constraint violation", e)
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error creating medical condition: {e}")
+        await db.rollback()
+        logger.error("Database error creating medical condition: %s", e)
         raise DatabaseError(f"Database operation failed: {str(e)}", e)
 
 
-def update_medical_condition(
-    db: Session,
+async def update_medical_condition(
+    db: AsyncSession,
     medical_condition_id: UUID,
     medical_condition_update: schemas.MedicalConditionUpdate
 ) -> Optional[models.MedicalCondition]:
@@ -178,29 +389,35 @@ def update_medical_condition(
         DatabaseError: If database operation fails
     """
     try:
-        db_condition = get_medical_condition(db, medical_condition_id)
+        update_data = _set_fields(medical_condition_update)
+        if not update_data:
+            return await get_medical_condition(db, medical_condition_id)
+        
+        db_condition = await _update_returning(
+            db,
+            models.MedicalCondition,
+            models.MedicalCondition.medical_condition_id,
+            medical_condition_id,
+            update_data
+        )
         if not db_condition:
             return None
         
-        update_data = medical_condition_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_condition, field, value)
-        
-        db.commit()
-        db.refresh(db_condition)
-        logger.info(f"Updated medical condition {medical_condition_id}")
+        await db.commit()
+        _medical_condition_cache.pop(medical_condition_id, None)
+        logger.info("Updated medical condition %s", medical_condition_id)
         return db_condition
     except IntegrityError as e:
-        db.rollback()
-        logger.error(f"Integrity error updating medical condition: {e}")
+        await db.rollback()
+        logger.error("Integrity error updating medical condition: %s", e)
         raise DatabaseError(f"Failed to update medical condition: duplicate name or constraint violation", e)
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error updating medical condition: {e}")
+        await db.rollback()
+        logger.error("Database error updating medical condition: %s", e)
         raise DatabaseError(f"Database operation failed: {str(e)}", e)
 
 
-def delete_medical_condition(db: Session, medical_condition_id: UUID) -> bool:
+async def delete_medical_condition(db: AsyncSession, medical_condition_id: UUID) -> bool:
     """
     Soft delete a medical condition (set is_active=False).
     
@@ -215,69 +432,123 @@ def delete_medical_condition(db: Session, medical_condition_id: UUID) -> bool:
         DatabaseError: If database operation fails
     """
     try:
-        db_condition = get_medical_condition(db, medical_condition_id)
-        if not db_condition:
+        found = await _soft_delete(
+            db, models.MedicalCondition.__table__,
+            models.MedicalCondition.medical_condition_id, medical_condition_id
+        )
+        if not found:
             return False
         
-        db_condition.is_active = False
-        db.commit()
-        logger.info(f"Soft deleted medical condition {medical_condition_id}")
+        await db.commit()
+        _medical_condition_cache.pop(medical_condition_id, None)
+        logger.info("Soft deleted medical condition %s", medical_condition_id)
         return True
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error deleting medical condition: {e}")
+        await db.rollback()
+        logger.error("Database error deleting medical condition: %s", e)
         raise DatabaseError(f"Database operation failed: {str(e)}", e)
 
 
-def get_patient(db: Session, patient_id: UUID) -> Optional[models.Patient]:
-    """Get a patient by ID with relationships."""
-    return db.query(models.Patient).filter(
-        models.Patient.patient_id == patient_id
-    ).first()
+async def get_patient(db: AsyncSession, patient_id: UUID) -> Optional[models.Patient]:
+    """Get a patient by ID with relationships, using the session identity map when possible."""
+    return await db.get(models.Patient, patient_id, options=_PATIENT_RELATIONSHIPS)
+
 
+async def get_patient_with_calls(db: AsyncSession, patient_id: UUID) -> Optional[models.Patient]:
+    """Get a patient by ID with relationships and call histories."""
+    result = await db.execute(
+        select(models.Patient).options(
+            *_PATIENT_RELATIONSHIPS,
+            selectinload(models.Patient.call_histories)
+        ).where(models.Patient.patient_id == patient_id)
+    )
+    return result.scalar_one_or_none()
 
-def get_patient_by_person_id(
-    db: Session, 
+
+async def get_patient_by_person_id(
+    db: AsyncSession, 
     person_id: UUID
 ) -> Optional[models.Patient]:
     """Get a patient by person ID."""
-    return db.query(models.Patient).filter(
-        models.Patient.person_id == person_id
-    ).first()
+    result = await db.execute(
+        lambda_stmt(lambda: select(models.Patient).where(models.Patient.person_id == person_id))
+    )
+    return result.scalars().first()
+
+
+async def patient_exists_for_person(db: AsyncSession, person_id: UUID) -> bool:
+    """Check whether a patient exists for a person without loading it."""
+    result = await db.execute(
+        lambda_stmt(lambda: select(exists().where(models.Patient.person_id == person_id)))
+    )
+    return result.scalar()
 
 
-def get_patients(
-    db: Session,
+async def get_patients(
+    db: AsyncSession,
     skip: int = 0,
     limit: int = 100,
     status: Optional[str] = None,
     medical_condition_id: Optional[UUID] = None
 ) -> Tuple[List[models.Patient], int]:
-    """Get multiple patients with pagination and filters."""
-    query = db.query(models.Patient)
+    """Get multiple patients, newest first, with pagination and filters."""
+    stmt = select(models.Patient).options(*_PATIENT_RELATIONSHIPS)
     
     if status:
-        query = query.filter(models.Patient.status == status)
+        stmt = stmt.where(models.Patient.status == status)
     
     if medical_condition_id:
-        query = query.filter(models.Patient.medical_condition_id == medical_condition_id)
+        stmt = stmt.where(models.Patient.medical_condition_id == medical_condition_id)
+    
+    stmt = stmt.order_by(models.Patient.created_at.desc(), models.Patient.patient_id.desc())
+    return await _paginate_with_total(db, stmt, skip, limit)
+
+
+async def get_patients_summary(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    status: Optional[str] = None,
+    medical_condition_id: Optional[UUID] = None
+) -> List[schemas.PatientSummary]:
+    """
+    Get a page of patient summaries without loading full ORM entities.
+    
+    Selects only the columns PatientSummary needs, joined to the person's
+    email, so no relationships are loaded and no instances are hydrated.
+    """
+    stmt = select(
+        models.Patient.patient_id,
+        models.Patient.status,
+        models.Patient.first_contact_date,
+        models.Patient.call_count,
+        models.Patient.last_call_at,
+        models.Person.email
+    ).join(models.Person, models.Patient.person_id == models.Person.person_id)
+    
+    if status:
+        stmt = stmt.where(models.Patient.status == status)
     
-    total = query.count()
-    patients = query.offset(skip).limit(limit).all()
+    if medical_condition_id:
+        stmt = stmt.where(models.Patient.medical_condition_id == medical_condition_id)
     
-    return patients, total
+    stmt = stmt.order_by(models.Patient.created_at.desc(), models.Patient.patient_id.desc())
+    rows = await db.execute(stmt.offset(skip).limit(limit))
+    return [schemas.PatientSummary.model_validate(row) for row in rows]
 
 
-def create_patient_with_person(
-    db: Session,
+async def create_patient_with_person(
+    db: AsyncSession,
     patient: schemas.PatientCreate
 ) -> models.Patient:
     """
     Create a new patient with person information.
     
     If a person with the provided email exists, the existing person record
-    is used (returning patient scenario). Otherwise, a new person record
-    is created.
+    is used (returning patient scenario) and its name and phone are
+    refreshed from the request. Otherwise, a new person record is created.
+    Both cases are a single UPSERT on email, followed by a patient INSERT
+    that yields no row if the person already has a patient.
     
     Args:
         db: Database session
@@ -292,57 +563,52 @@ def create_patient_with_person(
         DatabaseError: If database operation fails
     """
     try:
-        medical_condition = get_medical_condition(db, patient.medical_condition_id)
-        if not medical_condition:
+        if await _find_missing_medical_conditions(db, {patient.medical_condition_id}):
             raise MedicalConditionNotFoundError(str(patient.medical_condition_id))
         
-        db_person = get_person_by_email(db, patient.person.email)
+        person_stmt = pg_insert(models.Person).values(**patient.person.model_dump())
+        person_stmt = person_stmt.on_conflict_do_update(
+            index_elements=[models.Person.email],
+            set_={
+                "first_name": person_stmt.excluded.first_name,
+                "last_name": person_stmt.excluded.last_name,
+                "phone": func.coalesce(
+                    func.nullif(person_stmt.excluded.phone, ""), models.Person.phone
+                ),
+                "updated_at": func.now(),
+            }
+        ).returning(models.Person.person_id)
+        person_id = (await db.execute(person_stmt)).scalar_one()
         
-        if not db_person:
-            db_person = create_person(db, patient.person)
-            logger.info(f"Created new person {db_person.person_id} for patient")
-        else:
-            if patient.person.first_name:
-                db_person.first_name = patient.person.first_name
-            if patient.person.last_name:
-                db_person.last_name = patient.person.last_name
-            if patient.person.phone:
-                db_person.phone = patient.person.phone
-            db.commit()
-            db.refresh(db_person)
-            logger.info(f"Using existing person {db_person.person_id} for returning patient")
-        
-        existing_patient = get_patient_by_person_id(db, db_person.person_id)
-        if existing_patient:
-            raise DuplicatePatientError(str(db_person.person_id))
-        
-        db_patient = models.Patient(
-            person_id=db_person.person_id,
-            medical_condition_id=patient.medical_condition_id,
-            first_contact_date=patient.first_contact_date,
-            initial_consult_date=patient.initial_consult_date,
-            status=patient.status
+        patient_stmt = (
+            pg_insert(models.Patient)
+            .values(**patient.model_dump(exclude={"person"}), person_id=person_id)
+            .on_conflict_do_nothing(index_elements=[models.Patient.person_id])
+            .returning(models.Patient)
+            .options(*_PATIENT_RETURNING_RELATIONSHIPS)
         )
-        db.add(db_patient)
-        db.commit()
-        db.refresh(db_patient)
-        logger.info(f"Created patient {db_patient.patient_id} for person {db_person.person_id}")
+        db_patient = (await db.execute(patient_stmt)).scalar_one_or_none()
+        if db_patient is None:
+            raise DuplicatePatientError(str(person_id))
+        
+        await db.commit()
+        logger.info("Created patient %s for person %s", db_patient.patient_id, person_id)
         return db_patient
     except (DuplicatePatientError, MedicalConditionNotFoundError):
-        db.rollback()
+        await db.rollback()
         raise
     except IntegrityError as e:
-        db.rollback()
-        logger.error(f"Integrity error creating patient: {e}")
+        await db.rollback()
+        logger.error("Integrity error creating patient: %s", e)
         raise DatabaseError(f"Failed to create patient: constraint violation", e)
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error creating patient: {e}")
+        await db.rollback()
+        logger.error("Database error creating patient: %s", e)
         raise DatabaseError(f"Database operation failed: {str(e)}", e)
 
 
-def create_patient_with_existing_person(
-    db: Session,
+async def create_patient_with_existing_person(
+    db: AsyncSession,
     patient: schemas.PatientCreateWithPersonId
 ) -> models.Patient:
     """
@@ -362,101 +628,196 @@ def create_patient_with_existing_person(
         DatabaseError: If database operation fails
     """
     try:
-        db_person = get_person(db, patient.person_id)
+        db_person = await get_person(db, patient.person_id)
         if not db_person:
             raise PersonNotFoundError(person_id=str(patient.person_id))
         
-        medical_condition = get_medical_condition(db, patient.medical_condition_id)
-        if not medical_condition:
+        if await _find_missing_medical_conditions(db, {patient.medical_condition_id}):
             raise MedicalConditionNotFoundError(str(patient.medical_condition_id))
         
-        existing_patient = get_patient_by_person_id(db, patient.person_id)
-        if existing_patient:
+        if await patient_exists_for_person(db, patient.person_id):
             raise DuplicatePatientError(str(patient.person_id))
         
-        db_patient = models.Patient(
-            person_id=patient.person_id,
-            medical_condition_id=patient.medical_condition_id,
-            first_contact_date=patient.first_contact_date,
-            initial_consult_date=patient.initial_consult_date,
-            status=patient.status
+        db_patient = await _insert_returning(
+            db, models.Patient, patient.model_dump(), options=_PATIENT_RETURNING_RELATIONSHIPS
         )
-        db.add(db_patient)
-        db.commit()
-        db.refresh(db_patient)
-        logger.info(f"Created patient {db_patient.patient_id} for existing person {patient.person_id}")
+        await db.commit()
+        logger.info("Created patient %s for existing person %s", db_patient.patient_id, patient.person_id)
         return db_patient
     except (PersonNotFoundError, DuplicatePatientError, MedicalConditionNotFoundError):
-        db.rollback()
+        await db.rollback()
         raise
     except IntegrityError as e:
-        db.rollback()
-        logger.error(f"Integrity error creating patient: {e}")
+        await db.rollback()
+        logger.error("Integrity error creating patient: %s", e)
         raise DatabaseError(f"Failed to create patient: constraint violation", e)
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error creating patient: {e}")
+        await db.rollback()
+        logger.error("Database error creating patient: %s", e)
+        raise DatabaseError(f"Database operation failed: {str(e)}", e)
+
+
+async def bulk_create_patients(
+    db: AsyncSession,
+    patients: List[schemas.PatientCreateWithPersonId]
+) -> List[models.Patient]:
+    """
+    Create many patients for existing persons in a single INSERT.
+    
+    Referenced persons and medical conditions are validated with one query
+    each before inserting, and the whole batch is committed once.
+    
+    Args:
+        db: Database session
+        patients: Patient creation schemas with existing person IDs
+        
+    Returns:
+        Created Patient model instances, in input order
+        
+    Raises:
+        PersonNotFoundError: If any person doesn't exist
+        DuplicatePatientError: If a patient already exists for any person
+        MedicalConditionNotFoundError: If any medical condition doesn't exist
+        DatabaseError: If database operation fails
+    """
+    try:
+        person_ids = [p.person_id for p in patients]
+        found_persons = set((await db.execute(
+            select(models.Person.person_id).where(models.Person.person_id.in_(person_ids))
+        )).scalars())
+        for person_id in person_ids:
+            if person_id not in found_persons:
+                raise PersonNotFoundError(person_id=str(person_id))
+        
+        condition_ids = {p.medical_condition_id for p in patients}
+        for condition_id in await _find_missing_medical_conditions(db, condition_ids):
+            raise MedicalConditionNotFoundError(str(condition_id))
+        
+        seen = set((await db.execute(
+            select(models.Patient.person_id).where(models.Patient.person_id.in_(person_ids))
+        )).scalars())
+        for person_id in person_ids:
+            if person_id in seen:
+                raise DuplicatePatientError(str(person_id))
+            seen.add(person_id)
+        
+        db_patients = await _bulk_insert_returning(
+            db,
+            models.Patient,
+            [patient.model_dump() for patient in patients],
+            options=_PATIENT_RETURNING_RELATIONSHIPS
+        )
+        await db.commit()
+        logger.info("Bulk created %s patients", len(db_patients))
+        return db_patients
+    except (PersonNotFoundError, DuplicatePatientError, MedicalConditionNotFoundError):
+        await db.rollback()
+        raise
+    except IntegrityError as e:
+        await db.rollback()
+        logger.error("Integrity error bulk creating patients: %s", e)
+        raise DatabaseError(f"Failed to create patients: constraint violation", e)
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error("Database error bulk creating patients: %s", e)
         raise DatabaseError(f"Database operation failed: {str(e)}", e)
 
 
-def update_patient(
-    db: Session,
+async def update_patient(
+    db: AsyncSession,
     patient_id: UUID,
     patient_update: schemas.PatientUpdate
 ) -> Optional[models.Patient]:
     """Update a patient."""
-    db_patient = get_patient(db, patient_id)
-    if not db_patient:
-        return None
+    update_data = _set_fields(patient_update)
+    if not update_data:
+        return await get_patient(db, patient_id)
     
-    update_data = patient_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_patient, field, value)
-    
-    db.commit()
-    db.refresh(db_patient)
+    db_patient = await _update_returning(
+        db,
+        models.Patient,
+        models.Patient.patient_id,
+        patient_id,
+        update_data,
+        options=_PATIENT_RETURNING_RELATIONSHIPS
+    )
+    await db.commit()
     return db_patient
 
 
-def delete_patient(db: Session, patient_id: UUID) -> bool:
-    """Delete a patient (hard delete)."""
-    db_patient = get_patient(db, patient_id)
+async def delete_patient(db: AsyncSession, patient_id: UUID) -> bool:
+    """Delete a patient (hard delete); call history is removed by the database cascade."""
+    db_patient = await db.get(models.Patient, patient_id)
     if not db_patient:
         return False
     
-    db.delete(db_patient)
-    db.commit()
+    await db.delete(db_patient)
+    await db.commit()
     return True
 
 
-def get_call_history(db: Session, call_id: UUID) -> Optional[models.CallHistory]:
-    """Get a call history record by ID."""
-    return db.query(models.CallHistory).filter(
-        models.CallHistory.call_id == call_id
-    ).first()
+async def get_call_history(db: AsyncSession, call_id: UUID) -> Optional[models.CallHistory]:
+    """Get a call history record by ID, using the session identity map when possible."""
+    return await db.get(models.CallHistory, call_id)
 
 
-def get_call_histories_by_patient(
-    db: Session,
+_CALL_LIST_COLUMNS = tuple(
+    column for column in models.CallHistory.__table__.c if column.key != "notes"
+)
+
+
+async def get_call_histories_by_patient(
+    db: AsyncSession,
     patient_id: UUID,
     skip: int = 0,
     limit: int = 100
-) -> Tuple[List[models.CallHistory], int]:
-    """Get call histories for a patient."""
-    query = db.query(models.CallHistory).filter(
-        models.CallHistory.patient_id == patient_id
-    ).order_by(models.CallHistory.call_date.desc().nulls_last())
+) -> Optional[List[Row]]:
+    """
+    Get a page of a patient's calls, newest first, checking the patient exists.
     
-    total = query.count()
-    calls = query.offset(skip).limit(limit).all()
+    One query: the patient row is LEFT JOINed LATERAL to its page of calls,
+    so a missing patient (no rows) and a patient without calls (one row with
+    no call) are told apart without a separate existence check. The notes
+    TEXT column is not selected; list responses don't include it.
+    
+    Args:
+        db: Database session
+        patient_id: UUID of the patient
+        skip: Number of calls to skip
+        limit: Maximum number of calls to return
+        
+    Returns:
+        Call history rows (every column but notes), or None if the patient
+        doesn't exist
+    """
+    calls = models.CallHistory.__table__
+    page = (
+        select(*_CALL_LIST_COLUMNS)
+        .where(calls.c.patient_id == models.Patient.patient_id)
+        .order_by(calls.c.call_date.desc().nulls_last(), calls.c.call_id)
+        .offset(skip)
+        .limit(limit)
+        .subquery()
+        .lateral()
+    )
+    stmt = (
+        select(page)
+        .select_from(models.Patient)
+        .outerjoin(page, true())
+        .where(models.Patient.patient_id == patient_id)
+        .order_by(page.c.call_date.desc().nulls_last(), page.c.call_id)
+    )
     
-    return calls, total
+    rows = (await db.execute(stmt)).all()
+    if not rows:
+        return None
+    return [row for row in rows if row.call_id is not None]
 
 
-def create_call_history(
-    db: Session,
+async def create_call_history(
+    db: AsyncSession,
     call_history: schemas.CallHistoryCreate
-) -> models.CallHistory:
+) -> Row:
     """
     Create a new call history record.
     
@@ -465,67 +826,200 @@ def create_call_history(
         call_history: Call history creation schema
         
     Returns:
-        Created CallHistory model instance
+        Inserted call_history row (all columns)
         
     Raises:
         PatientNotFoundError: If patient doesn't exist
         DatabaseError: If database operation fails
     """
     try:
-        db_patient = get_patient(db, call_history.patient_id)
-        if not db_patient:
-            raise PatientNotFoundError(str(call_history.patient_id))
-        
-        db_call = models.CallHistory(
-            patient_id=call_history.patient_id,
-            pn_id=call_history.pn_id,
-            booking_date=call_history.booking_date,
-            call_date=call_history.call_date,
-            reminder_date=call_history.reminder_date,
-            no_show=call_history.no_show,
-            call_duration_minutes=call_history.call_duration_minutes,
-            outcome=call_history.outcome,
-            notes=call_history.notes
+        await _ensure_patients_exist(db, {call_history.patient_id})
+        
+        db_call = await _core_insert_returning(
+            db, models.CallHistory.__table__, call_history.model_dump()
         )
-        db.add(db_call)
-        db.commit()
-        db.refresh(db_call)
-        logger.info(f"Created call history {db_call.call_id} for patient {call_history.patient_id}")
+        await _record_new_calls(db, [db_call.call_id])
+        await db.commit()
+        logger.info("Created call history %s for patient %s", db_call.call_id, call_history.patient_id)
         return db_call
     except PatientNotFoundError:
-        db.rollback()
+        await db.rollback()
         raise
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error creating call history: {e}")
+        await db.rollback()
+        logger.error("Database error creating call history: %s", e)
         raise DatabaseError(f"Database operation failed: {str(e)}", e)
 
 
-def update_call_history(
-    db: Session,
+async def _ensure_patients_exist(db: AsyncSession, patient_ids: Set[UUID]) -> None:
+    """Raise PatientNotFoundError unless every patient ID exists (one query)."""
+    found = set((await db.execute(
+        select(models.Patient.patient_id).where(models.Patient.patient_id.in_(patient_ids))
+    )).scalars())
+    for patient_id in patient_ids - found:
+        raise PatientNotFoundError(str(patient_id))
+
+
+async def _record_new_calls(db: AsyncSession, call_ids: List[UUID]) -> None:
+    """
+    Add newly inserted calls to their patients' call_count and last_call_at.
+    
+    One UPDATE for the whole batch: the new calls are aggregated per patient
+    by primary key, so existing call history is never rescanned. The call IDs
+    travel as a single array parameter regardless of batch size.
+    """
+    calls = models.CallHistory.__table__
+    patient = models.Patient.__table__
+    ids = bindparam("call_ids", call_ids, type_=ARRAY(PG_UUID(as_uuid=True)))
+    new_calls = select(
+        calls.c.patient_id,
+        func.count().label("added"),
+        func.max(calls.c.call_date).label("latest")
+    ).where(calls.c.call_id == any_(ids)).group_by(calls.c.patient_id).subquery()
+    
+    await db.execute(
+        update(patient)
+        .where(patient.c.patient_id == new_calls.c.patient_id)
+        .values(
+            call_count=patient.c.call_count + new_calls.c.added,
+            last_call_at=func.greatest(patient.c.last_call_at, new_calls.c.latest),
+            updated_at=patient.c.updated_at
+        )
+    )
+
+
+async def _refresh_last_call_at(db: AsyncSession, patient_id: UUID, removed: int = 0) -> None:
+    """
+    Recompute a patient's last_call_at after calls were changed or removed.
+    
+    The MAX is served by the (patient_id, call_date DESC NULLS LAST) index.
+    
+    Args:
+        db: Database session
+        patient_id: Patient whose counters to refresh
+        removed: Number of the patient's calls that were deleted
+    """
+    calls = models.CallHistory.__table__
+    patient = models.Patient.__table__
+    latest = select(func.max(calls.c.call_date)).where(
+        calls.c.patient_id == patient_id
+    ).scalar_subquery()
+    
+    await db.execute(
+        update(patient)
+        .where(patient.c.patient_id == patient_id)
+        .values(
+            call_count=patient.c.call_count - removed,
+            last_call_at=latest,
+            updated_at=patient.c.updated_at
+        )
+    )
+
+
+async def bulk_create_call_history(
+    db: AsyncSession,
+    items: List[schemas.CallHistoryCreate]
+) -> List[models.CallHistory]:
+    """
+    Create many call history records in a single INSERT and commit once.
+    
+    Args:
+        db: Database session
+        items: Call history creation schemas
+        
+    Returns:
+        Created CallHistory model instances, in input order
+        
+    Raises:
+        PatientNotFoundError: If any referenced patient doesn't exist
+        DatabaseError: If database operation fails
+    """
+    try:
+        await _ensure_patients_exist(db, {item.patient_id for item in items})
+        
+        db_calls = await _bulk_insert_returning(
+            db, models.CallHistory, [item.model_dump() for item in items]
+        )
+        await _record_new_calls(db, [db_call.call_id for db_call in db_calls])
+        await db.commit()
+        logger.info("Bulk created %s call history records", len(db_calls))
+        return db_calls
+    except PatientNotFoundError:
+        await db.rollback()
+        raise
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error("Database error bulk creating call history: %s", e)
+        raise DatabaseError(f"Database operation failed: {str(e)}", e)
+
+
+async def insert_call_history_rows(db: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+    """
+    Insert buffered call history rows with one executemany INSERT.
+    
+    Unlike bulk_create_call_history, no rows are returned, so this is the
+    cheaper path for ingestion where callers don't need the new IDs.
+    
+    Args:
+        db: Database session
+        rows: Column dictionaries for CallHistory
+        
+    Returns:
+        Number of rows inserted
+        
+    Raises:
+        PatientNotFoundError: If any referenced patient doesn't exist
+        DatabaseError: If database operation fails
+    """
+    if not rows:
+        return 0
+    try:
+        await _ensure_patients_exist(db, {row["patient_id"] for row in rows})
+        
+        # IDs are assigned up front so the patient counters can be updated
+        # without RETURNING.
+        rows = [{"call_id": uuid7(), **row} for row in rows]
+        await db.execute(insert(models.CallHistory), rows)
+        await _record_new_calls(db, [row["call_id"] for row in rows])
+        await db.commit()
+        logger.info("Inserted %s buffered call history records", len(rows))
+        return len(rows)
+    except PatientNotFoundError:
+        await db.rollback()
+        raise
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error("Database error inserting buffered call history: %s", e)
+        raise DatabaseError(f"Database operation failed: {str(e)}", e)
+
+
+async def update_call_history(
+    db: AsyncSession,
     call_id: UUID,
     call_update: schemas.CallHistoryUpdate
 ) -> Optional[models.CallHistory]:
     """Update a call history record."""
-    db_call = get_call_history(db, call_id)
-    if not db_call:
-        return None
-    
-    update_data = call_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_call, field, value)
+    update_data = _set_fields(call_update)
+    if not update_data:
+        return await get_call_history(db, call_id)
     
-    db.commit()
-    db.refresh(db_call)
+    db_call = await _update_returning(
+        db, models.CallHistory, models.CallHistory.call_id, call_id, update_data
+    )
+    if db_call is not None and "call_date" in update_data:
+        await _refresh_last_call_at(db, db_call.patient_id)
+    await db.commit()
     return db_call
 
 
-def delete_call_history(db: Session, call_id: UUID) -> bool:
+async def delete_call_history(db: AsyncSession, call_id: UUID) -> bool:
     """Delete a call history record."""
-    db_call = get_call_history(db, call_id)
+    db_call = await get_call_history(db, call_id)
     if not db_call:
         return False
     
-    db.delete(db_call)
-    db.commit()
+    await db.delete(db_call)
+    await db.flush()
+    await _refresh_last_call_at(db, db_call.patient_id, removed=1)
+    await db.commit()
     return True
@@ -1,44 +1,121 @@
 """
 Database connection and session management.
 """
-from typing import Generator
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import declarative_base, sessionmaker, Session
-from app.config import settings
+from typing import Any, AsyncGenerator, Dict
+from uuid import uuid4
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from sqlalchemy.orm import DeclarativeBase, ORMExecuteState, raiseload, Session
+from sqlalchemy.pool import NullPool
+from app.config import Settings, settings
 from app.logger import logger
 
-engine = create_engine(
-    settings.get_database_url,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    pool_recycle=3600,
-    echo=settings.debug,
-)
+DATABASE_URL = settings.get_database_url
+
+
+def engine_options(config: Settings) -> Dict[str, Any]:
+    """
+    Build create_async_engine keyword arguments from settings.
+    
+    DB_STATEMENT_CACHE_SIZE=0 selects the PgBouncer transaction pooling
+    setup: both statement caches are off, prepared statements get unique
+    names so they can't collide on a shared server connection, and the
+    app keeps no pool of its own (NullPool), leaving pooling to PgBouncer.
+    
+    Args:
+        config: Application settings
+        
+    Returns:
+        Keyword arguments for create_async_engine
+    """
+    options: Dict[str, Any] = {
+        "insertmanyvalues_page_size": 1000,
+        "echo": config.debug,
+        "echo_pool": "debug" if config.debug else False,
+        "connect_args": {
+            "statement_cache_size": config.db_statement_cache_size,
+            "prepared_statement_cache_size": config.db_statement_cache_size,
+        },
+    }
+    if config.db_statement_cache_size == 0:
+        options["connect_args"]["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+        options["poolclass"] = NullPool
+    else:
+        options.update(
+            pool_pre_ping=True,
+            pool_size=config.db_pool_size,
+            max_overflow=config.db_max_overflow,
+            pool_recycle=config.db_pool_recycle,
+            pool_timeout=config.db_pool_timeout,
+            pool_use_lifo=True,
+        )
+    return options
+
+
+engine = create_async_engine(DATABASE_URL, **engine_options(settings))
+
+
+class AppSession(Session):
+    """
+    Sync Session class behind SessionLocal.
+    
+    Session events are registered on this subclass rather than on Session
+    itself, so they apply only to this app's sessions.
+    """
+    pass
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
+
+SessionLocal = async_sessionmaker(
+    engine,
+    sync_session_class=AppSession,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 
-@event.listens_for(engine, "connect")
-def set_sqlite_pragma(dbapi_conn, connection_record):
-    """Set database-specific connection parameters."""
+class Base(DeclarativeBase):
+    """Declarative base for all ORM models."""
     pass
 
 
-def get_db() -> Generator[Session, None, None]:
+def raise_on_unplanned_lazy_load(execute_state: ORMExecuteState) -> None:
+    """
+    Apply raiseload("*") to ORM SELECTs; registered in debug mode only.
+    
+    Relationships without an explicit loader option raise on access
+    instead of silently issuing a lazy SELECT, so N+1 patterns surface
+    during development and tests rather than under production load.
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+    ):
+        statement = execute_state.statement
+        if isinstance(statement, StatementLambdaElement):
+            # Extend the lambda instead of resolving it; .options() on the
+            # element would freeze the first call's bound values.
+            execute_state.statement = statement.add_criteria(lambda s: s.options(raiseload("*")))
+        else:
+            execute_state.statement = statement.options(raiseload("*"))
+
+
+if settings.debug:
+    event.listen(AppSession, "do_orm_execute", raise_on_unplanned_lazy_load)
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency function to get database session.
     
     Yields a database session and ensures it's properly closed after use,
     even if an exception occurs.
     """
-    db = SessionLocal()
-    try:
-        yield db
-    except Exception as e:
-        logger.error(f"Database session error: {e}")
-        db.rollback()
-        raise
-    finally:
-        db.close()
+    async with SessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error("Database session error: %s", e)
+            await db.rollback()
+            raise
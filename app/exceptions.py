@@ -2,6 +2,8 @@
 Custom exception classes for the application.
 """
 from typing import Optional
+from uuid import UUID
+from fastapi import HTTPException, status
 
 
 class PatientNotFoundError(Exception):
@@ -44,3 +46,20 @@ class DatabaseError(Exception):
     def __init__(self, message: str, original_error: Optional[Exception] = None):
         self.original_error = original_error
         super().__init__(message)
+
+
+def not_found(entity: str, entity_id: UUID) -> HTTPException:
+    """
+    Build the 404 response raised by routes when a record does not exist.
+    
+    Args:
+        entity: Human-readable entity name, e.g. "Patient"
+        entity_id: ID that was looked up
+        
+    Returns:
+        HTTPException with status 404 and a "<entity> <id> not found" detail
+    """
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"{entity} {entity_id} not found"
+    )
@@ -29,10 +29,7 @@ def setup_logging(log_level: Optional[str] = None) -> logging.Logger:
         ]
     )
     
-    logger = logging.getLogger("mytomorrows")
-    logger.setLevel(getattr(logging, level, logging.INFO))
-    
-    return logger
+    return logging.getLogger("mytomorrows")
 
 
 logger = setup_logging()
@@ -3,7 +3,7 @@ FastAPI application main file.
 """
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from app.responses import ORJSONResponse
 from app.config import settings
 from app.routes import patients, call_history, medical_conditions
 from app.exceptions import DatabaseError
@@ -29,9 +29,10 @@ app = FastAPI(
     * Preserved call history (no data loss)
     * Returning patient handling
     """,
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
+    docs_url="/docs" if settings.docs_enabled else None,
+    redoc_url="/redoc" if settings.docs_enabled else None,
+    openapi_url="/openapi.json" if settings.docs_enabled else None,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -57,7 +58,7 @@ app.include_router(
 
 
 @app.get("/", tags=["root"])
-def root() -> dict:
+async def root() -> dict:
     """
     Root endpoint providing API information.
     
@@ -73,7 +74,7 @@ def root() -> dict:
 
 
 @app.get("/health", tags=["health"])
-def health_check() -> dict:
+async def health_check() -> dict:
     """
     Health check endpoint for monitoring and load balancers.
     
@@ -88,7 +89,7 @@ def health_check() -> dict:
 
 
 @app.exception_handler(ValueError)
-async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
+async def value_error_handler(request: Request, exc: ValueError) -> ORJSONResponse:
     """
     Handle ValueError exceptions.
     
@@ -99,15 +100,15 @@ async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse
     Returns:
         JSON error response
     """
-    logger.warning(f"Validation error: {exc}")
-    return JSONResponse(
+    logger.warning("Validation error: %s", exc)
+    return ORJSONResponse(
         status_code=400,
         content={"detail": str(exc), "error_code": "VALIDATION_ERROR"},
     )
 
 
 @app.exception_handler(DatabaseError)
-async def database_error_handler(request: Request, exc: DatabaseError) -> JSONResponse:
+async def database_error_handler(request: Request, exc: DatabaseError) -> ORJSONResponse:
     """
     Handle DatabaseError exceptions.
     
@@ -118,8 +119,8 @@ async def database_error_handler(request: Request, exc: DatabaseError) -> JSONRe
     Returns:
         JSON error response
     """
-    logger.error(f"Database error: {exc}")
-    return JSONResponse(
+    logger.error("Database error: %s", exc)
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "An internal server error occurred", "error_code": "DATABASE_ERROR"},
     )
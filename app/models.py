@@ -1,48 +1,60 @@
 """
 SQLAlchemy models for the database.
 """
-from sqlalchemy import Column, String, Boolean, Date, DateTime, ForeignKey, Text, Integer
+from datetime import date, datetime
+from typing import List, Optional
+from sqlalchemy import String, Boolean, Date, DateTime, ForeignKey, Index, Text, Integer, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 import uuid
 from app.database import Base
+from app.ids import uuid7
 
 
 class Person(Base):
     """Person model representing the single source of truth for person information."""
     __tablename__ = "person"
     
-    person_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    first_name = Column(String(100), nullable=False)
-    last_name = Column(String(100), nullable=False)
-    email = Column(String(255), unique=True, nullable=False, index=True)
-    phone = Column(String(50))
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    is_active = Column(Boolean, default=True, nullable=False)
+    person_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    first_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    last_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    phone: Mapped[Optional[str]] = mapped_column(String(50))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     
-    patient = relationship("Patient", back_populates="person", uselist=False)
-    physician = relationship("Physician", back_populates="person", uselist=False)
-    navigated_calls = relationship("CallHistory", back_populates="patient_navigator", foreign_keys="CallHistory.pn_id")
+    patient: Mapped[Optional["Patient"]] = relationship(back_populates="person", lazy="raise_on_sql")
+    physician: Mapped[Optional["Physician"]] = relationship(back_populates="person", lazy="raise_on_sql")
+    navigated_calls: Mapped[List["CallHistory"]] = relationship(back_populates="patient_navigator", lazy="raise_on_sql")
     
     def __repr__(self):
-        return f"<Person(id={self.person_id}, email={self.email})>"
+        return f"<Person(id={self.person_id})>"
 
 
 class MedicalCondition(Base):
     """Medical Condition lookup table providing a single normalized source."""
     __tablename__ = "medical_condition"
-    
-    medical_condition_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String(200), unique=True, nullable=False)
-    abbreviation = Column(String(50))
-    description = Column(Text)
-    is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    
-    patients = relationship("Patient", back_populates="medical_condition")
+    __table_args__ = (
+        Index("idx_medical_condition_created", "created_at", "medical_condition_id"),
+        # Same ordering restricted to active conditions, which is what the
+        # condition pickers list; soft-deleted rows never enter it.
+        Index(
+            "idx_medical_condition_active_created", "created_at", "medical_condition_id",
+            postgresql_where=text("is_active")
+        ),
+    )
+    
+    medical_condition_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    name: Mapped[str] = mapped_column(String(200), unique=True, nullable=False)
+    abbreviation: Mapped[Optional[str]] = mapped_column(String(50))
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    
+    patients: Mapped[List["Patient"]] = relationship(back_populates="medical_condition", lazy="raise_on_sql")
     
     def __repr__(self):
         return f"<MedicalCondition(id={self.medical_condition_id}, name={self.name})>"
@@ -51,19 +63,29 @@ class MedicalCondition(Base):
 class Patient(Base):
     """Patient model representing a converted lead."""
     __tablename__ = "patient"
-    
-    patient_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    person_id = Column(UUID(as_uuid=True), ForeignKey("person.person_id"), unique=True, nullable=False, index=True)
-    medical_condition_id = Column(UUID(as_uuid=True), ForeignKey("medical_condition.medical_condition_id"), nullable=False, index=True)
-    first_contact_date = Column(Date)
-    initial_consult_date = Column(Date)
-    status = Column(String(50), default="active", nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    
-    person = relationship("Person", back_populates="patient")
-    medical_condition = relationship("MedicalCondition", back_populates="patients")
-    call_histories = relationship("CallHistory", back_populates="patient")
+    __table_args__ = (
+        # Backs the status / medical condition filters of the patient lists,
+        # in the lists' newest-first order.
+        Index("idx_patient_status", "status", "created_at"),
+        Index("idx_patient_status_condition", "status", "medical_condition_id", "created_at"),
+    )
+    
+    patient_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    person_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("person.person_id"), unique=True, nullable=False, index=True)
+    medical_condition_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("medical_condition.medical_condition_id"), nullable=False, index=True)
+    first_contact_date: Mapped[Optional[date]] = mapped_column(Date)
+    initial_consult_date: Mapped[Optional[date]] = mapped_column(Date)
+    status: Mapped[str] = mapped_column(String(50), default="active", nullable=False)
+    # Denormalized from call_history and kept current by the call history
+    # CRUD functions, so per-patient views don't aggregate the calls table.
+    call_count: Mapped[int] = mapped_column(Integer, default=0, server_default=text("0"), nullable=False)
+    last_call_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    
+    person: Mapped["Person"] = relationship(back_populates="patient", lazy="raise_on_sql")
+    medical_condition: Mapped["MedicalCondition"] = relationship(back_populates="patients", lazy="raise_on_sql")
+    call_histories: Mapped[List["CallHistory"]] = relationship(back_populates="patient", passive_deletes=True, lazy="raise_on_sql")
     
     def __repr__(self):
         return f"<Patient(id={self.patient_id}, person_id={self.person_id})>"
@@ -72,21 +94,26 @@ class Patient(Base):
 class CallHistory(Base):
     """Call History model tracking all calls and interactions with Patient Navigators."""
     __tablename__ = "call_history"
-    
-    call_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    patient_id = Column(UUID(as_uuid=True), ForeignKey("patient.patient_id"), nullable=False, index=True)
-    pn_id = Column(UUID(as_uuid=True), ForeignKey("person.person_id"), index=True)
-    booking_date = Column(DateTime(timezone=True), index=True)
-    call_date = Column(DateTime(timezone=True))
-    reminder_date = Column(DateTime(timezone=True))
-    no_show = Column(Boolean, default=False, nullable=False)
-    call_duration_minutes = Column(Integer)
-    outcome = Column(String(100))
-    notes = Column(Text)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    
-    patient = relationship("Patient", back_populates="call_histories")
-    patient_navigator = relationship("Person", back_populates="navigated_calls", foreign_keys="CallHistory.pn_id")
+    __table_args__ = (
+        # Serves a patient's timeline (WHERE patient_id = ? ORDER BY call_date
+        # DESC NULLS LAST) in index order, and patient_id lookups on its own.
+        Index("idx_call_history_patient", "patient_id", text("call_date DESC NULLS LAST")),
+    )
+    
+    call_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    patient_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("patient.patient_id", ondelete="CASCADE"), nullable=False)
+    pn_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("person.person_id"), index=True)
+    booking_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), index=True)
+    call_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    reminder_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    no_show: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    call_duration_minutes: Mapped[Optional[int]] = mapped_column(Integer)
+    outcome: Mapped[Optional[str]] = mapped_column(String(100))
+    notes: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    patient: Mapped["Patient"] = relationship(back_populates="call_histories", lazy="raise_on_sql")
+    patient_navigator: Mapped[Optional["Person"]] = relationship(back_populates="navigated_calls", lazy="raise_on_sql")
     
     def __repr__(self):
         return f"<CallHistory(id={self.call_id}, patient_id={self.patient_id})>"
@@ -96,17 +123,17 @@ class Physician(Base):
     """Physician model representing healthcare providers."""
     __tablename__ = "physician"
     
-    physician_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    person_id = Column(UUID(as_uuid=True), ForeignKey("person.person_id"), unique=True, nullable=False, index=True)
-    hospital_id = Column(UUID(as_uuid=True), ForeignKey("hospital.hospital_id"), index=True)
-    job_title = Column(String(200))
-    specialization_id = Column(UUID(as_uuid=True), ForeignKey("specialization.specialization_id"), index=True)
-    medical_license_number = Column(String(100))
-    is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    physician_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    person_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("person.person_id"), unique=True, nullable=False, index=True)
+    hospital_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("hospital.hospital_id"), index=True)
+    job_title: Mapped[Optional[str]] = mapped_column(String(200))
+    specialization_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("specialization.specialization_id"), index=True)
+    medical_license_number: Mapped[Optional[str]] = mapped_column(String(100))
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
-    person = relationship("Person", back_populates="physician")
+    person: Mapped["Person"] = relationship(back_populates="physician", lazy="raise_on_sql")
     
     def __repr__(self):
         return f"<Physician(id={self.physician_id}, person_id={self.person_id})>"
@@ -116,14 +143,14 @@ class Hospital(Base):
     """Hospital lookup table providing normalized hospital information."""
     __tablename__ = "hospital"
     
-    hospital_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String(200), nullable=False)
-    city = Column(String(100))
-    country = Column(String(100))
-    address = Column(Text)
-    is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    hospital_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
+    city: Mapped[Optional[str]] = mapped_column(String(100))
+    country: Mapped[Optional[str]] = mapped_column(String(100))
+    address: Mapped[Optional[str]] = mapped_column(Text)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     def __repr__(self):
         return f"<Hospital(id={self.hospital_id}, name={self.name})>"
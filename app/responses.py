@@ -0,0 +1,30 @@
+"""
+JSON response classes.
+"""
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+
+
+def _default(obj: Any) -> Any:
+    """Encode types orjson doesn't handle natively."""
+    # asyncpg returns its own uuid.UUID subclass, which orjson only
+    # serializes as an exact uuid.UUID.
+    if isinstance(obj, UUID):
+        return str(obj)
+    raise TypeError
+
+
+class ORJSONResponse(_ORJSONResponse):
+    """ORJSONResponse that also accepts database-driver UUID values."""
+    
+    def render(self, content: Any) -> bytes:
+        # OPT_UTC_Z writes UTC offsets as "Z", matching what Pydantic emits
+        # for response_model routes.
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+        )
@@ -2,13 +2,16 @@
 Call History API routes with CRUD operations.
 """
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List
 from uuid import UUID
 
 from app import crud, schemas
+from app.buffer import BulkBuffer, get_bulk_buffer
 from app.database import get_db
-from app.exceptions import PatientNotFoundError, DatabaseError
+from app.exceptions import PatientNotFoundError, not_found
 from app.logger import logger
+from app.responses import ORJSONResponse
 
 router = APIRouter(
     prefix="/call-history",
@@ -16,6 +19,20 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+_RESPONSE_FIELDS = tuple(schemas.CallHistoryResponse.model_fields)
+
+
+def _to_response_dict(db_call: Any) -> Dict[str, Any]:
+    """
+    Read the CallHistoryResponse fields straight off a CallHistory row.
+    
+    Rows come from our own INSERT/SELECT, so they are returned as an
+    ORJSONResponse without the per-field revalidation FastAPI would run
+    against response_model. response_model stays on the routes for the
+    OpenAPI schema.
+    """
+    return {field: getattr(db_call, field) for field in _RESPONSE_FIELDS}
+
 
 @router.post(
     "/",
@@ -24,10 +41,10 @@ router = APIRouter(
     summary="Create a new call history record",
     description="Create a new call history record for a patient. Multiple calls per patient are supported."
 )
-def create_call_history(
+async def create_call_history(
     call_history: schemas.CallHistoryCreate,
-    db: Session = Depends(get_db)
-) -> schemas.CallHistoryResponse:
+    db: AsyncSession = Depends(get_db)
+) -> ORJSONResponse:
     """
     Create a new call history record.
     
@@ -43,36 +60,105 @@ def create_call_history(
         
     Raises:
         HTTPException: 404 if patient not found
-                      500 if database operation fails
+        DatabaseError: if the database operation fails (returned as 500 by the app handler)
     """
     try:
-        db_call = crud.create_call_history(db, call_history)
-        logger.info(f"Successfully created call history {db_call.call_id}")
-        return db_call
+        db_call = await crud.create_call_history(db, call_history)
+        logger.info("Successfully created call history %s", db_call.call_id)
+        return ORJSONResponse(_to_response_dict(db_call), status_code=status.HTTP_201_CREATED)
     except PatientNotFoundError as e:
-        logger.warning(f"Patient not found for call history: {e}")
+        logger.warning("Patient not found for call history: %s", e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
-    except DatabaseError as e:
-        logger.error(f"Database error creating call history: {e}")
+
+
+@router.post(
+    "/bulk",
+    response_model=list[schemas.CallHistoryResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create call history records in bulk",
+    description="Create many call history records with a single database round-trip."
+)
+async def bulk_create_call_history(
+    call_histories: List[schemas.CallHistoryCreate],
+    db: AsyncSession = Depends(get_db)
+) -> ORJSONResponse:
+    """
+    Create many call history records at once.
+    
+    All records are inserted with one statement and committed together;
+    if any referenced patient is missing, nothing is created.
+    
+    Args:
+        call_histories: Call history creation schemas
+        db: Database session dependency
+        
+    Returns:
+        Created call history responses, in request order
+        
+    Raises:
+        HTTPException: 404 if any patient not found
+        DatabaseError: if the database operation fails (returned as 500 by the app handler)
+    """
+    try:
+        db_calls = await crud.bulk_create_call_history(db, call_histories)
+        logger.info("Successfully created %s call history records", len(db_calls))
+        return ORJSONResponse(
+            [_to_response_dict(db_call) for db_call in db_calls],
+            status_code=status.HTTP_201_CREATED
+        )
+    except PatientNotFoundError as e:
+        logger.warning("Patient not found for call history: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create call history due to database error"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
         )
 
 
+@router.post(
+    "/import",
+    response_model=schemas.CallHistoryImportResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Import call history records",
+    description="Queue call history records and write them with one INSERT at the end of the request. Generated IDs are not returned."
+)
+async def import_call_history(
+    call_histories: List[schemas.CallHistoryCreate],
+    buffer: BulkBuffer = Depends(get_bulk_buffer)
+) -> schemas.CallHistoryImportResponse:
+    """
+    Import call history records through the request write buffer.
+    
+    Use this instead of the bulk endpoint when the created records don't
+    need to be returned; the rows are inserted without RETURNING.
+    
+    Args:
+        call_histories: Call history creation schemas
+        buffer: Request write buffer dependency
+        
+    Returns:
+        Number of records written
+        
+    Raises:
+        HTTPException: 404 if any patient not found
+    """
+    for call_history in call_histories:
+        buffer.add_call_history(call_history)
+    return schemas.CallHistoryImportResponse(inserted=len(buffer.call_history_rows))
+
+
 @router.get(
     "/{call_id}",
     response_model=schemas.CallHistoryResponse,
     summary="Get a call history record by ID",
     description="Get detailed information about a specific call history record."
 )
-def read_call_history(
+async def read_call_history(
     call_id: UUID,
-    db: Session = Depends(get_db)
-) -> schemas.CallHistoryResponse:
+    db: AsyncSession = Depends(get_db)
+) -> ORJSONResponse:
     """
     Get a call history record by ID.
     
@@ -86,14 +172,11 @@ def read_call_history(
     Raises:
         HTTPException: 404 if call history not found
     """
-    db_call = crud.get_call_history(db, call_id=call_id)
+    db_call = await crud.get_call_history(db, call_id=call_id)
     if db_call is None:
-        logger.warning(f"Call history {call_id} not found")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Call history {call_id} not found"
-        )
-    return db_call
+        logger.warning("Call history %s not found", call_id)
+        raise not_found("Call history", call_id)
+    return ORJSONResponse(_to_response_dict(db_call))
 
 
 @router.put(
@@ -102,11 +185,11 @@ def read_call_history(
     summary="Update a call history record",
     description="Update call history information. Only provided fields will be updated."
 )
-def update_call_history(
+async def update_call_history(
     call_id: UUID,
     call_update: schemas.CallHistoryUpdate,
-    db: Session = Depends(get_db)
-) -> schemas.CallHistoryResponse:
+    db: AsyncSession = Depends(get_db)
+) -> ORJSONResponse:
     """
     Update a call history record.
     
@@ -124,15 +207,12 @@ def update_call_history(
     Raises:
         HTTPException: 404 if call history not found
     """
-    db_call = crud.update_call_history(db, call_id=call_id, call_update=call_update)
+    db_call = await crud.update_call_history(db, call_id=call_id, call_update=call_update)
     if db_call is None:
-        logger.warning(f"Call history {call_id} not found for update")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Call history {call_id} not found"
-        )
-    logger.info(f"Successfully updated call history {call_id}")
-    return db_call
+        logger.warning("Call history %s not found for update", call_id)
+        raise not_found("Call history", call_id)
+    logger.info("Successfully updated call history %s", call_id)
+    return ORJSONResponse(_to_response_dict(db_call))
 
 
 @router.delete(
@@ -141,9 +221,9 @@ def update_call_history(
     summary="Delete a call history record",
     description="Delete a call history record."
 )
-def delete_call_history(
+async def delete_call_history(
     call_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> None:
     """
     Delete a call history record.
@@ -155,12 +235,9 @@ def delete_call_history(
     Raises:
         HTTPException: 404 if call history not found
     """
-    success = crud.delete_call_history(db, call_id=call_id)
+    success = await crud.delete_call_history(db, call_id=call_id)
     if not success:
-        logger.warning(f"Call history {call_id} not found for deletion")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Call history {call_id} not found"
-        )
-    logger.info(f"Successfully deleted call history {call_id}")
+        logger.warning("Call history %s not found for deletion", call_id)
+        raise not_found("Call history", call_id)
+    logger.info("Successfully deleted call history %s", call_id)
     return None
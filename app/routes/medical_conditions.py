@@ -1,15 +1,17 @@
 """
 Medical Condition API routes.
 """
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
-from typing import Optional, List
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 from uuid import UUID
 
 from app import crud, schemas
 from app.database import get_db
-from app.exceptions import MedicalConditionNotFoundError, DatabaseError
+from app.exceptions import MedicalConditionNotFoundError, not_found
 from app.logger import logger
+from app.responses import ORJSONResponse
 
 router = APIRouter(
     prefix="/medical-conditions",
@@ -17,6 +19,13 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Pages of the list endpoint keyed by (cursor, limit, is_active). The table
+# is a write-rare lookup, so list reads are served from memory for up to a
+# minute; any write through this router clears it. Per process only.
+_list_cache: TTLCache = TTLCache(maxsize=64, ttl=60)
+
+_RESPONSE_FIELDS = tuple(schemas.MedicalConditionResponse.model_fields)
+
 
 @router.post(
     "/",
@@ -25,9 +34,9 @@ router = APIRouter(
     summary="Create a new medical condition",
     description="Create a new medical condition in the lookup table."
 )
-def create_medical_condition(
+async def create_medical_condition(
     medical_condition: schemas.MedicalConditionCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> schemas.MedicalConditionResponse:
     """
     Create a new medical condition in the lookup table.
@@ -40,46 +49,60 @@ def create_medical_condition(
         Created medical condition response
         
     Raises:
-        HTTPException: 500 if database operation fails
+        DatabaseError: if the database operation fails (returned as 500 by the app handler)
     """
-    try:
-        db_condition = crud.create_medical_condition(db, medical_condition)
-        logger.info(f"Successfully created medical condition {db_condition.medical_condition_id}")
-        return db_condition
-    except DatabaseError as e:
-        logger.error(f"Database error creating medical condition: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create medical condition due to database error"
-        )
+    db_condition = await crud.create_medical_condition(db, medical_condition)
+    _list_cache.clear()
+    logger.info("Successfully created medical condition %s", db_condition.medical_condition_id)
+    return db_condition
 
 
 @router.get(
     "/",
-    response_model=list[schemas.MedicalConditionResponse],
+    response_model=schemas.PaginatedMedicalConditions,
     summary="Get all medical conditions",
-    description="Get a list of medical conditions with optional filtering."
+    description="Get a cursor-paginated list of medical conditions with optional filtering."
 )
-def read_medical_conditions(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+async def read_medical_conditions(
+    cursor: Optional[UUID] = Query(None, description="next_cursor from the previous page"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
-    db: Session = Depends(get_db)
-) -> List[schemas.MedicalConditionResponse]:
+    db: AsyncSession = Depends(get_db)
+) -> ORJSONResponse:
     """
-    Get a list of medical conditions with optional filtering.
+    Get a page of medical conditions with optional filtering.
+    
+    Pages are built straight from the ORM rows and returned as an
+    ORJSONResponse, skipping per-row response_model validation; up to
+    1000 rows per page make that the dominant cost of this endpoint.
     
     Args:
-        skip: Number of records to skip (for pagination)
+        cursor: next_cursor returned with the previous page (omit for the first page)
         limit: Maximum number of records to return (max 1000)
         is_active: Filter by active status
         db: Database session dependency
         
     Returns:
-        List of medical condition responses
+        Page of medical condition responses and the cursor for the next page
     """
-    conditions = crud.get_medical_conditions(db, skip=skip, limit=limit, is_active=is_active)
-    return conditions
+    cache_key = (cursor, limit, is_active)
+    page = _list_cache.get(cache_key)
+    if page is None:
+        # One extra row tells whether another page exists, so a final page
+        # that happens to be full doesn't hand out a cursor to an empty one.
+        conditions = await crud.get_medical_conditions(db, cursor=cursor, limit=limit + 1, is_active=is_active)
+        has_more = len(conditions) > limit
+        conditions = conditions[:limit]
+        next_cursor = conditions[-1].medical_condition_id if has_more else None
+        page = {
+            "items": [
+                {field: getattr(condition, field) for field in _RESPONSE_FIELDS}
+                for condition in conditions
+            ],
+            "next_cursor": next_cursor,
+        }
+        _list_cache[cache_key] = page
+    return ORJSONResponse(page)
 
 
 @router.get(
@@ -88,9 +111,9 @@ def read_medical_conditions(
     summary="Get a medical condition by ID",
     description="Get detailed information about a specific medical condition."
 )
-def read_medical_condition(
+async def read_medical_condition(
     medical_condition_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> schemas.MedicalConditionResponse:
     """
     Get a medical condition by ID.
@@ -105,13 +128,10 @@ def read_medical_condition(
     Raises:
         HTTPException: 404 if medical condition not found
     """
-    db_condition = crud.get_medical_condition(db, medical_condition_id=medical_condition_id)
+    db_condition = await crud.get_medical_condition(db, medical_condition_id=medical_condition_id)
     if db_condition is None:
-        logger.warning(f"Medical condition {medical_condition_id} not found")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Medical condition {medical_condition_id} not found"
-        )
+        logger.warning("Medical condition %s not found", medical_condition_id)
+        raise not_found("Medical condition", medical_condition_id)
     return db_condition
 
 
@@ -121,10 +141,10 @@ def read_medical_condition(
     summary="Update a medical condition",
     description="Update an existing medical condition in the lookup table."
 )
-def update_medical_condition(
+async def update_medical_condition(
     medical_condition_id: UUID,
     medical_condition_update: schemas.MedicalConditionUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> schemas.MedicalConditionResponse:
     """
     Update an existing medical condition.
@@ -138,24 +158,16 @@ def update_medical_condition(
         Updated medical condition response
         
     Raises:
-        HTTPException: 404 if medical condition not found, 500 if database operation fails
+        HTTPException: 404 if medical condition not found
+        DatabaseError: if the database operation fails (returned as 500 by the app handler)
     """
-    try:
-        db_condition = crud.update_medical_condition(db, medical_condition_id, medical_condition_update)
-        if db_condition is None:
-            logger.warning(f"Medical condition {medical_condition_id} not found")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Medical condition {medical_condition_id} not found"
-            )
-        logger.info(f"Successfully updated medical condition {medical_condition_id}")
-        return db_condition
-    except DatabaseError as e:
-        logger.error(f"Database error updating medical condition: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update medical condition due to database error"
-        )
+    db_condition = await crud.update_medical_condition(db, medical_condition_id, medical_condition_update)
+    if db_condition is None:
+        logger.warning("Medical condition %s not found", medical_condition_id)
+        raise not_found("Medical condition", medical_condition_id)
+    _list_cache.clear()
+    logger.info("Successfully updated medical condition %s", medical_condition_id)
+    return db_condition
 
 
 @router.delete(
@@ -164,9 +176,9 @@ def update_medical_condition(
     summary="Delete a medical condition",
     description="Soft delete a medical condition by setting is_active=False."
 )
-def delete_medical_condition(
+async def delete_medical_condition(
     medical_condition_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> None:
     """
     Soft delete a medical condition (sets is_active=False).
@@ -176,20 +188,12 @@ def delete_medical_condition(
         db: Database session dependency
         
     Raises:
-        HTTPException: 404 if medical condition not found, 500 if database operation fails
+        HTTPException: 404 if medical condition not found
+        DatabaseError: if the database operation fails (returned as 500 by the app handler)
     """
-    try:
-        success = crud.delete_medical_condition(db, medical_condition_id)
-        if not success:
-            logger.warning(f"Medical condition {medical_condition_id} not found")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Medical condition {medical_condition_id} not found"
-            )
-        logger.info(f"Successfully soft deleted medical condition {medical_condition_id}")
-    except DatabaseError as e:
-        logger.error(f"Database error deleting medical condition: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete medical condition due to database error"
-        )
\ No newline at end of file
+    success = await crud.delete_medical_condition(db, medical_condition_id)
+    if not success:
+        logger.warning("Medical condition %s not found", medical_condition_id)
+        raise not_found("Medical condition", medical_condition_id)
+    _list_cache.clear()
+    logger.info("Successfully soft deleted medical condition %s", medical_condition_id)
\ No newline at end of file
@@ -1,11 +1,11 @@
 """
 Patient API routes with CRUD operations.
 """
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
-from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, List, Optional
 from uuid import UUID
-from math import ceil
+import hashlib
 
 from app import crud, schemas
 from app.database import get_db
@@ -14,9 +14,10 @@ from app.exceptions import (
     PersonNotFoundError,
     DuplicatePatientError,
     MedicalConditionNotFoundError,
-    DatabaseError
+    not_found
 )
 from app.logger import logger
+from app.responses import ORJSONResponse
 
 router = APIRouter(
     prefix="/patients",
@@ -25,6 +26,40 @@ router = APIRouter(
 )
 
 
+def _patient_version(db_patient: Any) -> tuple:
+    """
+    Everything a PatientResponse depends on that can change.
+    
+    The nested person and condition have their own updated_at, and the call
+    counters are maintained without touching patient.updated_at, so all of
+    them are part of the version.
+    """
+    return (
+        db_patient.patient_id,
+        db_patient.updated_at,
+        db_patient.call_count,
+        db_patient.last_call_at,
+        db_patient.person.updated_at,
+        db_patient.medical_condition.updated_at,
+    )
+
+
+def _etag(*parts: Any) -> str:
+    """Build a weak ETag from the given version parts."""
+    return 'W/"%s"' % hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response if the request's If-None-Match matches etag."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return None
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    if etag in candidates or "*" in candidates:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
+
+
 @router.post(
     "/",
     response_model=schemas.PatientResponse,
@@ -32,9 +67,9 @@ router = APIRouter(
     summary="Create a new patient",
     description="Create a new patient with person information. If person with email exists, uses existing person (handles returning patients)."
 )
-def create_patient(
+async def create_patient(
     patient: schemas.PatientCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> schemas.PatientResponse:
     """
     Create a new patient.
@@ -54,31 +89,24 @@ def create_patient(
     Raises:
         HTTPException: 400 if validation fails or patient already exists
                       404 if medical condition not found
-                      500 if database operation fails
+        DatabaseError: if the database operation fails (returned as 500 by the app handler)
     """
     try:
-        db_patient = crud.create_patient_with_person(db, patient)
-        db.refresh(db_patient)
-        logger.info(f"Successfully created patient {db_patient.patient_id}")
+        db_patient = await crud.create_patient_with_person(db, patient)
+        logger.info("Successfully created patient %s", db_patient.patient_id)
         return db_patient
     except DuplicatePatientError as e:
-        logger.warning(f"Attempted to create duplicate patient: {e}")
+        logger.warning("Attempted to create duplicate patient: %s", e)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
     except MedicalConditionNotFoundError as e:
-        logger.warning(f"Medical condition not found: {e}")
+        logger.warning("Medical condition not found: %s", e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
-    except DatabaseError as e:
-        logger.error(f"Database error creating patient: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create patient due to database error"
-        )
 
 
 @router.post(
@@ -88,9 +116,9 @@ def create_patient(
     summary="Create a patient with existing person ID",
     description="Create a new patient using an existing person ID."
 )
-def create_patient_with_person_id(
+async def create_patient_with_person_id(
     patient: schemas.PatientCreateWithPersonId,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> schemas.PatientResponse:
     """
     Create a patient with existing person ID.
@@ -105,36 +133,82 @@ def create_patient_with_person_id(
     Raises:
         HTTPException: 404 if person or medical condition not found
                       409 if patient already exists
-                      500 if database operation fails
+        DatabaseError: if the database operation fails (returned as 500 by the app handler)
     """
     try:
-        db_patient = crud.create_patient_with_existing_person(db, patient)
-        db.refresh(db_patient)
-        logger.info(f"Successfully created patient {db_patient.patient_id} with existing person")
+        db_patient = await crud.create_patient_with_existing_person(db, patient)
+        logger.info("Successfully created patient %s with existing person", db_patient.patient_id)
         return db_patient
     except PersonNotFoundError as e:
-        logger.warning(f"Person not found: {e}")
+        logger.warning("Person not found: %s", e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
     except DuplicatePatientError as e:
-        logger.warning(f"Attempted to create duplicate patient: {e}")
+        logger.warning("Attempted to create duplicate patient: %s", e)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
     except MedicalConditionNotFoundError as e:
-        logger.warning(f"Medical condition not found: {e}")
+        logger.warning("Medical condition not found: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
+@router.post(
+    "/bulk",
+    response_model=list[schemas.PatientResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create patients in bulk",
+    description="Create many patients for existing person IDs with a single database round-trip."
+)
+async def bulk_create_patients(
+    patients: List[schemas.PatientCreateWithPersonId],
+    db: AsyncSession = Depends(get_db)
+) -> List[schemas.PatientResponse]:
+    """
+    Create many patients for existing persons at once.
+    
+    All patients are inserted with one statement and committed together;
+    if any item fails validation, nothing is created.
+    
+    Args:
+        patients: Patient creation schemas with existing person IDs
+        db: Database session dependency
+        
+    Returns:
+        Created patient responses, in request order
+        
+    Raises:
+        HTTPException: 404 if any person or medical condition not found
+                      409 if a patient already exists for any person
+        DatabaseError: if the database operation fails (returned as 500 by the app handler)
+    """
+    try:
+        db_patients = await crud.bulk_create_patients(db, patients)
+        logger.info("Successfully created %s patients", len(db_patients))
+        return db_patients
+    except PersonNotFoundError as e:
+        logger.warning("Person not found: %s", e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
-    except DatabaseError as e:
-        logger.error(f"Database error creating patient: {e}")
+    except DuplicatePatientError as e:
+        logger.warning("Attempted to create duplicate patient: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create patient due to database error"
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except MedicalConditionNotFoundError as e:
+        logger.warning("Medical condition not found: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
         )
 
 
@@ -144,34 +218,72 @@ def create_patient_with_person_id(
     summary="Get all patients",
     description="Get a paginated list of patients with optional filtering."
 )
-def read_patients(
+async def read_patients(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     status: Optional[str] = Query(None, description="Filter by patient status"),
     medical_condition_id: Optional[UUID] = Query(None, description="Filter by medical condition ID"),
-    db: Session = Depends(get_db)
-):
+    db: AsyncSession = Depends(get_db)
+) -> ORJSONResponse:
     """
     Get patients with pagination and filtering.
     
+    The page is validated once through PATIENT_LIST_ADAPTER and returned as
+    an ORJSONResponse, so FastAPI doesn't rebuild and revalidate every
+    nested PatientResponse against response_model. The response carries an
+    ETag over the page's row versions; a matching If-None-Match gets a 304
+    without serializing the page.
+    
     - **skip**: Number of records to skip (for pagination)
     - **limit**: Maximum number of records to return (max 1000)
     - **status**: Filter by patient status (e.g., 'active', 'inactive')
     - **medical_condition_id**: Filter by medical condition UUID
     """
-    patients, total = crud.get_patients(
+    patients, total = await crud.get_patients(
         db, skip=skip, limit=limit, status=status, medical_condition_id=medical_condition_id
     )
     
-    total_pages = ceil(total / limit) if limit > 0 else 0
-    page = (skip // limit) + 1 if limit > 0 else 1
+    # limit is validated to be >= 1, so integer ceiling division is safe.
+    total_pages = -(-total // limit)
+    page = skip // limit + 1
+    
+    etag = _etag(total, skip, limit, *(_patient_version(p) for p in patients))
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
     
-    return schemas.PatientListResponse(
-        items=patients,
-        total=total,
-        page=page,
-        page_size=limit,
-        total_pages=total_pages
+    items = schemas.PATIENT_LIST_ADAPTER.validate_python(patients, from_attributes=True)
+    return ORJSONResponse({
+        "items": schemas.PATIENT_LIST_ADAPTER.dump_python(items, mode="json"),
+        "total": total,
+        "page": page,
+        "page_size": limit,
+        "total_pages": total_pages
+    }, headers={"ETag": etag})
+
+
+@router.get(
+    "/summary",
+    response_model=list[schemas.PatientSummary],
+    summary="Get patient summaries",
+    description="Get a lightweight list of patients (ID, status, first contact date, call count, last call time, email) with optional filtering."
+)
+async def read_patients_summary(
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    status: Optional[str] = Query(None, description="Filter by patient status"),
+    medical_condition_id: Optional[UUID] = Query(None, description="Filter by medical condition ID"),
+    db: AsyncSession = Depends(get_db)
+) -> List[schemas.PatientSummary]:
+    """
+    Get patient summaries with pagination and filtering.
+    
+    Use this instead of the full list when only identifying fields are
+    needed; person and medical condition details are not included.
+    """
+    return await crud.get_patients_summary(
+        db, skip=skip, limit=limit, status=status, medical_condition_id=medical_condition_id
     )
 
 
@@ -181,15 +293,22 @@ def read_patients(
     summary="Get a patient by ID",
     description="Get detailed information about a specific patient."
 )
-def read_patient(
+async def read_patient(
     patient_id: UUID,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
 ) -> schemas.PatientResponse:
     """
     Get a patient by ID.
     
+    The response carries an ETag; a matching If-None-Match gets a 304
+    without a body.
+    
     Args:
         patient_id: UUID of the patient
+        request: Incoming request, for If-None-Match
+        response: Outgoing response, for the ETag header
         db: Database session dependency
         
     Returns:
@@ -198,13 +317,16 @@ def read_patient(
     Raises:
         HTTPException: 404 if patient not found
     """
-    db_patient = crud.get_patient(db, patient_id=patient_id)
+    db_patient = await crud.get_patient(db, patient_id=patient_id)
     if db_patient is None:
-        logger.warning(f"Patient {patient_id} not found")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Patient {patient_id} not found"
-        )
+        logger.warning("Patient %s not found", patient_id)
+        raise not_found("Patient", patient_id)
+    
+    etag = _etag(_patient_version(db_patient))
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    response.headers["ETag"] = etag
     return db_patient
 
 
@@ -214,18 +336,15 @@ def read_patient(
     summary="Update a patient",
     description="Update patient information. Only provided fields will be updated."
 )
-def update_patient(
+async def update_patient(
     patient_id: UUID,
     patient_update: schemas.PatientUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a patient."""
-    db_patient = crud.update_patient(db, patient_id=patient_id, patient_update=patient_update)
+    db_patient = await crud.update_patient(db, patient_id=patient_id, patient_update=patient_update)
     if db_patient is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Patient {patient_id} not found"
-        )
+        raise not_found("Patient", patient_id)
     return db_patient
 
 
@@ -235,39 +354,36 @@ def update_patient(
     summary="Delete a patient",
     description="Delete a patient record (hard delete)."
 )
-def delete_patient(
+async def delete_patient(
     patient_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a patient."""
-    success = crud.delete_patient(db, patient_id=patient_id)
+    success = await crud.delete_patient(db, patient_id=patient_id)
     if not success:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Patient {patient_id} not found"
-        )
+        raise not_found("Patient", patient_id)
     return None
 
 
 @router.get(
     "/{patient_id}/calls",
-    response_model=list[schemas.CallHistoryResponse],
+    response_model=list[schemas.CallHistoryListItem],
     summary="Get call history for a patient",
-    description="Get all call history records for a specific patient."
+    description="Get call history records for a specific patient, newest first. Notes are omitted; fetch a single record for them."
 )
-def get_patient_calls(
+async def get_patient_calls(
     patient_id: UUID,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: Session = Depends(get_db)
-):
-    """Get call history for a patient."""
-    db_patient = crud.get_patient(db, patient_id)
-    if db_patient is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Patient {patient_id} not found"
-        )
+    db: AsyncSession = Depends(get_db)
+) -> ORJSONResponse:
+    """
+    Get call history for a patient, without notes.
     
-    calls, total = crud.get_call_histories_by_patient(db, patient_id, skip=skip, limit=limit)
-    return calls
+    Rows come straight from the projection query and are returned as an
+    ORJSONResponse without per-row response_model validation.
+    """
+    calls = await crud.get_call_histories_by_patient(db, patient_id, skip=skip, limit=limit)
+    if calls is None:
+        raise not_found("Patient", patient_id)
+    return ORJSONResponse([call._asdict() for call in calls])
@@ -1,7 +1,7 @@
 """
 Pydantic schemas for request/response validation.
 """
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, TypeAdapter
 from typing import Optional, List
 from datetime import date, datetime
 from uuid import UUID
@@ -29,8 +29,15 @@ class PersonUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
+# Emails read back from the database were validated on the way in, so
+# response schemas declare them as plain strings (still documented as
+# format "email") instead of running email-validator again on every row.
+_StoredEmail = Field(..., description="Email address", json_schema_extra={"format": "email"})
+
+
 class PersonResponse(PersonBase):
     """Schema for Person response."""
+    email: str = _StoredEmail
     person_id: UUID
     created_at: datetime
     updated_at: datetime
@@ -69,6 +76,14 @@ class MedicalConditionResponse(MedicalConditionBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class PaginatedMedicalConditions(BaseModel):
+    """Schema for a keyset-paginated Medical Condition list response."""
+    items: List[MedicalConditionResponse]
+    next_cursor: Optional[UUID] = Field(
+        None, description="Cursor for the next page; null when there are no more results"
+    )
+
+
 class PatientBase(BaseModel):
     """Base schema for Patient."""
     medical_condition_id: UUID = Field(..., description="Medical condition ID")
@@ -99,6 +114,8 @@ class PatientResponse(PatientBase):
     """Schema for Patient response."""
     patient_id: UUID
     person_id: UUID
+    call_count: int = 0
+    last_call_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
     person: Optional[PersonResponse] = None
@@ -107,6 +124,18 @@ class PatientResponse(PatientBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class PatientSummary(BaseModel):
+    """Schema for a lightweight Patient list entry."""
+    patient_id: UUID
+    status: str
+    first_contact_date: Optional[date] = None
+    call_count: int = 0
+    last_call_at: Optional[datetime] = None
+    email: str = _StoredEmail
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
 class PatientListResponse(BaseModel):
     """Schema for paginated Patient list response."""
     items: List[PatientResponse]
@@ -116,6 +145,10 @@ class PatientListResponse(BaseModel):
     total_pages: int
 
 
+# Validates a page of Patient ORM rows in one call (built once at import).
+PATIENT_LIST_ADAPTER = TypeAdapter(List[PatientResponse])
+
+
 class CallHistoryBase(BaseModel):
     """Base schema for Call History."""
     patient_id: UUID = Field(..., description="Patient ID")
@@ -154,6 +187,27 @@ class CallHistoryResponse(CallHistoryBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class CallHistoryListItem(BaseModel):
+    """Schema for a Call History entry in a list; notes are left out."""
+    call_id: UUID
+    patient_id: UUID
+    pn_id: Optional[UUID] = None
+    booking_date: Optional[datetime] = None
+    call_date: Optional[datetime] = None
+    reminder_date: Optional[datetime] = None
+    no_show: bool
+    call_duration_minutes: Optional[int] = None
+    outcome: Optional[str] = None
+    created_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CallHistoryImportResponse(BaseModel):
+    """Schema for a buffered call history import."""
+    inserted: int = Field(..., description="Number of call history records written")
+
+
 class ErrorResponse(BaseModel):
     """Schema for error responses."""
     detail: str
@@ -2,10 +2,12 @@
 Example usage of the API.
 Demonstrates how to interact with the FastAPI endpoints.
 """
-import requests
+import asyncio
 import json
 from uuid import UUID
 
+import httpx
+
 
 BASE_URL = "http://localhost:8000/api/v1"
 
@@ -23,15 +25,15 @@ def print_response(response, title="Response"):
     print()
 
 
-def example_create_patient():
+async def example_create_patient(client: httpx.AsyncClient):
     """Example: Create a patient."""
     print("\n" + "="*60)
     print("Example 1: Create a Patient")
     print("="*60)
     
-    response = requests.get(f"{BASE_URL}/medical-conditions")
+    response = await client.get("/medical-conditions")
     if response.status_code == 200:
-        conditions = response.json()
+        conditions = response.json()["items"]
         if conditions:
             medical_condition_id = conditions[0]["medical_condition_id"]
         else:
@@ -54,8 +56,8 @@ def example_create_patient():
         "status": "active"
     }
     
-    response = requests.post(
-        f"{BASE_URL}/patients",
+    response = await client.post(
+        "/patients",
         json=patient_data
     )
     
@@ -66,31 +68,30 @@ def example_create_patient():
     return None
 
 
-def example_get_patients():
+async def example_get_patients(client: httpx.AsyncClient):
     """Example: Get all patients."""
-    print("\n" + "="*60)
-    print("Example 2: Get All Patients")
-    print("="*60)
-    
-    response = requests.get(
-        f"{BASE_URL}/patients",
+    response = await client.get(
+        "/patients",
         params={"skip": 0, "limit": 10}
     )
     
+    print("\n" + "="*60)
+    print("Example 2: Get All Patients")
+    print("="*60)
     print_response(response, "Get Patients")
 
 
-def example_get_patient(patient_id: str):
+async def example_get_patient(client: httpx.AsyncClient, patient_id: str):
     """Example: Get a specific patient."""
+    response = await client.get(f"/patients/{patient_id}")
+    
     print("\n" + "="*60)
     print(f"Example 3: Get Patient {patient_id}")
     print("="*60)
-    
-    response = requests.get(f"{BASE_URL}/patients/{patient_id}")
     print_response(response, "Get Patient")
 
 
-def example_create_call_history(patient_id: str):
+async def example_create_call_history(client: httpx.AsyncClient, patient_id: str):
     """Example: Create call history."""
     print("\n" + "="*60)
     print("Example 4: Create Call History")
@@ -107,25 +108,25 @@ def example_create_call_history(patient_id: str):
         "notes": "Patient is interested in clinical trial options"
     }
     
-    response = requests.post(
-        f"{BASE_URL}/call-history",
+    response = await client.post(
+        "/call-history",
         json=call_data
     )
     
     print_response(response, "Create Call History")
 
 
-def example_get_patient_calls(patient_id: str):
+async def example_get_patient_calls(client: httpx.AsyncClient, patient_id: str):
     """Example: Get call history for a patient."""
+    response = await client.get(f"/patients/{patient_id}/calls")
+    
     print("\n" + "="*60)
     print(f"Example 5: Get Call History for Patient {patient_id}")
     print("="*60)
-    
-    response = requests.get(f"{BASE_URL}/patients/{patient_id}/calls")
     print_response(response, "Get Patient Calls")
 
 
-def example_update_patient(patient_id: str):
+async def example_update_patient(client: httpx.AsyncClient, patient_id: str):
     """Example: Update a patient."""
     print("\n" + "="*60)
     print(f"Example 6: Update Patient {patient_id}")
@@ -136,23 +137,23 @@ def example_update_patient(patient_id: str):
         "initial_consult_date": "2024-01-22"
     }
     
-    response = requests.put(
-        f"{BASE_URL}/patients/{patient_id}",
+    response = await client.put(
+        f"/patients/{patient_id}",
         json=update_data
     )
     
     print_response(response, "Update Patient")
 
 
-def example_returning_patient():
+async def example_returning_patient(client: httpx.AsyncClient):
     """Example: Handle returning patient (same email)."""
     print("\n" + "="*60)
     print("Example 7: Returning Patient (Same Email)")
     print("="*60)
     
-    response = requests.get(f"{BASE_URL}/medical-conditions")
+    response = await client.get("/medical-conditions")
     if response.status_code == 200:
-        conditions = response.json()
+        conditions = response.json()["items"]
         if conditions:
             medical_condition_id = conditions[0]["medical_condition_id"]
         else:
@@ -172,14 +173,32 @@ def example_returning_patient():
         "status": "active"
     }
     
-    response = requests.post(
-        f"{BASE_URL}/patients",
+    response = await client.post(
+        "/patients",
         json=patient_data
     )
     
     print_response(response, "Returning Patient")
 
 
+async def main():
+    """Run the examples against a running API with one shared client."""
+    async with httpx.AsyncClient(base_url=BASE_URL, follow_redirects=True) as client:
+        patient_id = await example_create_patient(client)
+        
+        if patient_id:
+            await example_create_call_history(client, str(patient_id))
+            # Independent reads run concurrently against the async API.
+            await asyncio.gather(
+                example_get_patients(client),
+                example_get_patient(client, str(patient_id)),
+                example_get_patient_calls(client, str(patient_id)),
+            )
+            await example_update_patient(client, str(patient_id))
+        
+        await example_returning_patient(client)
+
+
 if __name__ == "__main__":
     print("\n" + "="*60)
     print("FastAPI Example Usage")
@@ -188,16 +207,7 @@ if __name__ == "__main__":
     print("Press Enter to continue...")
     input()
     
-    patient_id = example_create_patient()
-    
-    if patient_id:
-        example_get_patients()
-        example_get_patient(str(patient_id))
-        example_create_call_history(str(patient_id))
-        example_get_patient_calls(str(patient_id))
-        example_update_patient(str(patient_id))
-    
-    example_returning_patient()
+    asyncio.run(main())
     
     print("\n" + "="*60)
     print("Examples complete!")
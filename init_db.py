@@ -2,92 +2,102 @@
 Database initialization script.
 Creates tables and optionally seeds initial data.
 """
-from sqlalchemy import create_engine, text
+import argparse
+import asyncio
+from sqlalchemy import func, insert, select, text
 from app.database import Base, engine
 from app.config import settings
 from app import models
 import sys
 
 
-def init_database():
+async def init_database():
     """Create all database tables."""
     print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
     print("✓ Tables created successfully")
 
 
-def seed_medical_conditions():
+async def seed_medical_conditions():
     """Seed initial medical conditions."""
     from app.database import SessionLocal
     from app import models
     
-    db = SessionLocal()
-    try:
-        existing = db.query(models.MedicalCondition).count()
-        if existing > 0:
-            print(f"✓ Medical conditions already exist ({existing} records)")
-            return
-        
-        conditions = [
-            models.MedicalCondition(
-                name="Duchenne Muscular Dystrophy",
-                abbreviation="DMD",
-                description="A genetic disorder characterized by progressive muscle degeneration"
-            ),
-            models.MedicalCondition(
-                name="Glioblastoma",
-                abbreviation="GBM",
-                description="An aggressive type of brain cancer"
-            ),
-            models.MedicalCondition(
-                name="Idiopathic Pulmonary Fibrosis",
-                abbreviation="IPF",
-                description="A chronic lung disease characterized by progressive scarring"
-            ),
-        ]
-        
-        for condition in conditions:
-            db.add(condition)
-        
-        db.commit()
-        print(f"✓ Seeded {len(conditions)} medical conditions")
-    except Exception as e:
-        print(f"✗ Error seeding medical conditions: {e}")
-        db.rollback()
-    finally:
-        db.close()
+    async with SessionLocal() as db:
+        try:
+            existing = await db.scalar(select(func.count()).select_from(models.MedicalCondition))
+            if existing > 0:
+                print(f"✓ Medical conditions already exist ({existing} records)")
+                return
+            
+            conditions = [
+                {
+                    "name": "Duchenne Muscular Dystrophy",
+                    "abbreviation": "DMD",
+                    "description": "A genetic disorder characterized by progressive muscle degeneration",
+                },
+                {
+                    "name": "Glioblastoma",
+                    "abbreviation": "GBM",
+                    "description": "An aggressive type of brain cancer",
+                },
+                {
+                    "name": "Idiopathic Pulmonary Fibrosis",
+                    "abbreviation": "IPF",
+                    "description": "A chronic lung disease characterized by progressive scarring",
+                },
+            ]
+            
+            await db.execute(insert(models.MedicalCondition), conditions)
+            await db.commit()
+            print(f"✓ Seeded {len(conditions)} medical conditions")
+        except Exception as e:
+            print(f"✗ Error seeding medical conditions: {e}")
+            await db.rollback()
 
 
-def verify_connection():
-    """Verify database connection."""
+async def verify_connection(verbose: bool = False):
+    """Verify database connection, printing the server version if verbose."""
     try:
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT version()"))
-            version = result.fetchone()[0]
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
             print(f"✓ Database connection successful")
-            print(f"  PostgreSQL version: {version}")
+            if verbose:
+                version = await conn.scalar(text("SELECT version()"))
+                print(f"  PostgreSQL version: {version}")
             return True
     except Exception as e:
         print(f"✗ Database connection failed: {e}")
         return False
 
 
-if __name__ == "__main__":
+async def main(verbose: bool = False):
     print("=" * 60)
     print("Database Initialization Script")
     print("=" * 60)
     print()
     
-    if not verify_connection():
-        print("\nPlease check your POSTGRES_* variables in .env file")
-        sys.exit(1)
-    
-    print()
-    init_database()
-    print()
-    seed_medical_conditions()
-    print()
+    try:
+        if not await verify_connection(verbose):
+            print("\nPlease check your POSTGRES_* variables in .env file")
+            sys.exit(1)
+        
+        print()
+        await init_database()
+        print()
+        await seed_medical_conditions()
+        print()
+    finally:
+        await engine.dispose()
     
     print("=" * 60)
     print("Database initialization complete!")
     print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create tables and seed initial data.")
+    parser.add_argument("--verbose", action="store_true", help="print the PostgreSQL server version")
+    args = parser.parse_args()
+    asyncio.run(main(verbose=args.verbose))
@@ -108,6 +108,8 @@ CREATE TABLE patient (
     first_contact_date DATE,
     initial_consult_date DATE,
     status VARCHAR(50) NOT NULL DEFAULT 'active',
+    call_count INTEGER NOT NULL DEFAULT 0,
+    last_call_at TIMESTAMP,
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
@@ -209,6 +211,10 @@ CREATE INDEX idx_person_contact_type_active ON person_contact_type(is_active, va
 CREATE UNIQUE INDEX idx_unique_active_contact_type ON person_contact_type(person_id, contact_type_id) 
     WHERE is_active = TRUE;
 
+-- Medical Condition indexes
+CREATE INDEX idx_medical_condition_created ON medical_condition(created_at, medical_condition_id);
+CREATE INDEX idx_medical_condition_active_created ON medical_condition(created_at, medical_condition_id) WHERE is_active;
+
 -- Patient Lead indexes
 CREATE INDEX idx_patient_lead_person ON patient_lead(person_id);
 CREATE INDEX idx_patient_lead_condition ON patient_lead(medical_condition_id);
@@ -219,9 +225,10 @@ CREATE INDEX idx_patient_lead_converted ON patient_lead(converted_to_patient_id)
 CREATE INDEX idx_patient_person ON patient(person_id);
 CREATE INDEX idx_patient_condition ON patient(medical_condition_id);
 CREATE INDEX idx_patient_status ON patient(status, created_at);
+CREATE INDEX idx_patient_status_condition ON patient(status, medical_condition_id, created_at);
 
 -- Call History indexes
-CREATE INDEX idx_call_history_patient ON call_history(patient_id, call_date);
+CREATE INDEX idx_call_history_patient ON call_history(patient_id, call_date DESC NULLS LAST);
 CREATE INDEX idx_call_history_booking ON call_history(booking_date);
 CREATE INDEX idx_call_history_pn ON call_history(pn_id);
 
@@ -0,0 +1,106 @@
+"""
+Shared pytest fixtures.
+"""
+import uuid
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from app import crud
+from app.database import AppSession, engine, raise_on_unplanned_lazy_load
+from app.main import app
+
+# Rows created by tests are tagged with this prefix (person emails and
+# medical condition names) so cleanup never touches other data.
+TEST_PREFIX = "test-"
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    TestClient shared by the whole test session.
+    
+    Entering the client once runs the app lifespan a single time and keeps
+    one event loop for all requests, so pooled asyncpg connections are
+    reused across tests instead of being tied to a per-request loop.
+    """
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def run(client):
+    """
+    Run an async function on the client's event loop and return its result.
+    
+    Pooled connections belong to that loop, so direct CRUD calls in tests
+    must go through it rather than asyncio.run().
+    """
+    return client.portal.call
+
+
+async def _delete_test_rows() -> None:
+    """Delete everything created under TEST_PREFIX."""
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "DELETE FROM call_history WHERE patient_id IN ("
+            " SELECT p.patient_id FROM patient p JOIN person pe USING (person_id)"
+            " WHERE pe.email LIKE :prefix)"
+        ), {"prefix": TEST_PREFIX + "%"})
+        await conn.execute(text(
+            "DELETE FROM patient WHERE person_id IN ("
+            " SELECT person_id FROM person WHERE email LIKE :prefix)"
+        ), {"prefix": TEST_PREFIX + "%"})
+        await conn.execute(text("DELETE FROM person WHERE email LIKE :prefix"), {"prefix": TEST_PREFIX + "%"})
+        await conn.execute(text("DELETE FROM medical_condition WHERE name LIKE :prefix"), {"prefix": TEST_PREFIX + "%"})
+    # Conditions were hard-deleted behind the app's back; forget them.
+    crud._medical_condition_cache.clear()
+
+
+@pytest.fixture
+def cleanup(run):
+    """Remove the rows a test created once it finishes."""
+    yield
+    run(_delete_test_rows)
+
+
+def unique_email() -> str:
+    """Return an email address tagged for cleanup."""
+    return f"{TEST_PREFIX}{uuid.uuid4().hex[:12]}@example.com"
+
+
+@pytest.fixture
+def medical_condition(client, cleanup):
+    """Create a medical condition through the API."""
+    response = client.post(
+        "/api/v1/medical-conditions/",
+        json={"name": f"{TEST_PREFIX}{uuid.uuid4().hex[:12]}", "abbreviation": "TC"}
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.fixture
+def create_patient(client, medical_condition):
+    """Factory that creates a patient (and its person) through the API."""
+    def _create(**person):
+        response = client.post(
+            "/api/v1/patients/",
+            json={
+                "person": {"first_name": "Jane", "last_name": "Doe", "email": unique_email(), **person},
+                "medical_condition_id": medical_condition["medical_condition_id"]
+            }
+        )
+        assert response.status_code == 201
+        return response.json()
+    return _create
+
+
+@pytest.fixture
+def debug_raiseload():
+    """Register the DEBUG-mode raiseload listener for one test."""
+    registered = event.contains(AppSession, "do_orm_execute", raise_on_unplanned_lazy_load)
+    if not registered:
+        event.listen(AppSession, "do_orm_execute", raise_on_unplanned_lazy_load)
+    yield
+    if not registered:
+        event.remove(AppSession, "do_orm_execute", raise_on_unplanned_lazy_load)
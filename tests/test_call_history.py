@@ -0,0 +1,110 @@
+"""
+Tests for Call History endpoints.
+"""
+import uuid
+
+
+def test_read_call_history_malformed_id(client):
+    """Test a malformed call ID is a validation error, not a missing route."""
+    assert client.get("/api/v1/call-history/not-a-uuid").status_code == 422
+    assert client.get("/api/v1/call-history/0123456789abcdef").status_code == 422
+
+
+def test_bulk_create_call_history(client, create_patient):
+    """Test bulk creation returns the records in request order."""
+    patient = create_patient()
+    response = client.post(
+        "/api/v1/call-history/bulk",
+        json=[
+            {"patient_id": patient["patient_id"], "outcome": "first"},
+            {"patient_id": patient["patient_id"], "outcome": "second"}
+        ]
+    )
+    assert response.status_code == 201
+    assert [c["outcome"] for c in response.json()] == ["first", "second"]
+    assert len({c["call_id"] for c in response.json()}) == 2
+
+
+def test_bulk_create_call_history_missing_patient(client, create_patient):
+    """Test an unknown patient in the batch returns 404 and creates nothing."""
+    patient = create_patient()
+    response = client.post(
+        "/api/v1/call-history/bulk",
+        json=[
+            {"patient_id": patient["patient_id"]},
+            {"patient_id": str(uuid.uuid4())}
+        ]
+    )
+    assert response.status_code == 404
+    assert client.get(f"/api/v1/patients/{patient['patient_id']}/calls").json() == []
+
+
+def test_import_call_history(client, create_patient):
+    """Test buffered import writes every queued record."""
+    patient = create_patient()
+    response = client.post(
+        "/api/v1/call-history/import",
+        json=[{"patient_id": patient["patient_id"], "outcome": "imported"}] * 3
+    )
+    assert response.status_code == 201
+    assert response.json() == {"inserted": 3}
+    calls = client.get(f"/api/v1/patients/{patient['patient_id']}/calls").json()
+    assert [c["outcome"] for c in calls] == ["imported"] * 3
+
+
+def test_import_call_history_missing_patient(client, create_patient):
+    """Test a buffered row for an unknown patient returns 404 and writes nothing."""
+    patient = create_patient()
+    response = client.post(
+        "/api/v1/call-history/import",
+        json=[
+            {"patient_id": patient["patient_id"]},
+            {"patient_id": str(uuid.uuid4())}
+        ]
+    )
+    assert response.status_code == 404
+    assert client.get(f"/api/v1/patients/{patient['patient_id']}/calls").json() == []
+
+
+def test_import_call_history_empty(client):
+    """Test an empty import is accepted without touching the database."""
+    response = client.post("/api/v1/call-history/import", json=[])
+    assert response.status_code == 201
+    assert response.json() == {"inserted": 0}
+
+
+def _counters(client, patient_id):
+    """Return a patient's call_count and last_call_at (to the second, without offset)."""
+    patient = client.get(f"/api/v1/patients/{patient_id}").json()
+    return patient["call_count"], patient["last_call_at"] and patient["last_call_at"][:19]
+
+
+def test_patient_call_counters(client, create_patient):
+    """Test every write path keeps call_count and last_call_at in step."""
+    patient_id = create_patient()["patient_id"]
+    assert _counters(client, patient_id) == (0, None)
+    
+    single = client.post(
+        "/api/v1/call-history/",
+        json={"patient_id": patient_id, "call_date": "2024-01-10T09:00:00Z"}
+    ).json()
+    assert _counters(client, patient_id) == (1, "2024-01-10T09:00:00")
+    
+    client.post(
+        "/api/v1/call-history/bulk",
+        json=[
+            {"patient_id": patient_id, "call_date": "2024-03-01T09:00:00Z"},
+            {"patient_id": patient_id}
+        ]
+    )
+    client.post(
+        "/api/v1/call-history/import",
+        json=[{"patient_id": patient_id, "call_date": "2024-02-01T09:00:00Z"}]
+    )
+    assert _counters(client, patient_id) == (4, "2024-03-01T09:00:00")
+    
+    client.put(f"/api/v1/call-history/{single['call_id']}", json={"call_date": "2024-05-01T09:00:00Z"})
+    assert _counters(client, patient_id) == (4, "2024-05-01T09:00:00")
+    
+    assert client.delete(f"/api/v1/call-history/{single['call_id']}").status_code == 204
+    assert _counters(client, patient_id) == (3, "2024-03-01T09:00:00")
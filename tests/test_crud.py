@@ -0,0 +1,51 @@
+"""
+Tests for CRUD lookups.
+"""
+import uuid
+
+from app import crud
+from app.database import SessionLocal
+
+
+def test_lookups_bind_each_call_in_debug(run, client, create_patient, debug_raiseload):
+    """
+    Test non-PK lookups return the row for the key passed on every call.
+    
+    The debug listener rewrites each ORM SELECT, which must not freeze the
+    parameters of the first call into later ones.
+    """
+    first, second = create_patient(), create_patient()
+    assert client.delete(f"/api/v1/patients/{second['patient_id']}").status_code == 204
+    first_person_id = uuid.UUID(first["person_id"])
+    second_person_id = uuid.UUID(second["person_id"])
+    
+    async def lookups():
+        async with SessionLocal() as db:
+            return (
+                (await crud.get_person_by_email(db, first["person"]["email"])).person_id,
+                (await crud.get_person_by_email(db, second["person"]["email"])).person_id,
+                await crud.get_person_by_email(db, "nobody@example.com"),
+                await crud.patient_exists_for_person(db, first_person_id),
+                await crud.patient_exists_for_person(db, second_person_id),
+                (await crud.get_patient_by_person_id(db, first_person_id)).person_id,
+                await crud.get_patient_by_person_id(db, second_person_id),
+            )
+    
+    assert run(lookups) == (
+        first_person_id, second_person_id, None, True, False, first_person_id, None
+    )
+
+
+def test_medical_condition_existence_cache(run, medical_condition):
+    """Test found condition IDs are cached and unknown ones are not."""
+    known = uuid.UUID(medical_condition["medical_condition_id"])
+    unknown = uuid.uuid4()
+    crud._medical_condition_cache.clear()
+    
+    async def find_missing():
+        async with SessionLocal() as db:
+            return await crud._find_missing_medical_conditions(db, {known, unknown})
+    
+    assert run(find_missing) == {unknown}
+    assert known in crud._medical_condition_cache
+    assert unknown not in crud._medical_condition_cache
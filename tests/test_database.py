@@ -0,0 +1,101 @@
+"""
+Tests for database session setup.
+"""
+import uuid
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from app import crud, models
+from app.config import Settings
+from app.database import AppSession, SessionLocal, engine_options, raise_on_unplanned_lazy_load
+
+
+def test_raiseload_listener_is_scoped_to_app_sessions(debug_raiseload):
+    """Test the listener is not registered on the global Session class."""
+    assert not event.contains(Session, "do_orm_execute", raise_on_unplanned_lazy_load)
+
+
+def _raiseload_applied(statement) -> bool:
+    """Whether the statement carries the listener's raiseload("*") option."""
+    return any(
+        getattr(option, "strategy", None) == (("lazy", "raise"),)
+        for option in statement._with_options
+    )
+
+
+def test_raiseload_applied_to_orm_selects_in_debug(run, create_patient, debug_raiseload):
+    """Test ORM SELECTs through SessionLocal get raiseload("*") added."""
+    patient_id = uuid.UUID(create_patient()["patient_id"])
+    statements = []
+    
+    def capture(execute_state):
+        statements.append(execute_state.statement)
+    
+    async def select_patient():
+        async with SessionLocal() as db:
+            await db.execute(select(models.Patient).where(models.Patient.patient_id == patient_id))
+    
+    event.listen(AppSession, "do_orm_execute", capture)
+    try:
+        run(select_patient)
+    finally:
+        event.remove(AppSession, "do_orm_execute", capture)
+    
+    assert len(statements) == 1
+    assert _raiseload_applied(statements[0])
+
+
+def test_planned_loads_work_in_debug(run, create_patient, debug_raiseload):
+    """Test CRUD reads that declare their loaders are unaffected."""
+    patient = create_patient()
+    
+    async def planned_access():
+        async with SessionLocal() as db:
+            db_patient = await crud.get_patient(db, uuid.UUID(patient["patient_id"]))
+            return db_patient.person.email
+    
+    assert run(planned_access) == patient["person"]["email"]
+
+
+def test_raiseload_applied_to_lambda_statements_in_debug(run, debug_raiseload):
+    """Test lambda_stmt lookups get raiseload("*") and stay lambda statements."""
+    statements = []
+    
+    def capture(execute_state):
+        statements.append(execute_state.statement)
+    
+    async def lookup():
+        async with SessionLocal() as db:
+            await crud.get_person_by_email(db, "nobody@example.com")
+    
+    event.listen(AppSession, "do_orm_execute", capture)
+    try:
+        run(lookup)
+    finally:
+        event.remove(AppSession, "do_orm_execute", capture)
+    
+    assert isinstance(statements[0], StatementLambdaElement)
+    assert _raiseload_applied(statements[0]._resolved)
+
+
+def test_engine_options_for_pgbouncer_transaction_pooling():
+    """Test DB_STATEMENT_CACHE_SIZE=0 names statements uniquely and drops the app pool."""
+    options = engine_options(Settings(db_statement_cache_size=0))
+    connect_args = options["connect_args"]
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    names = {connect_args["prepared_statement_name_func"]() for _ in range(3)}
+    assert len(names) == 3
+    assert all(name.startswith("__asyncpg_") and name.endswith("__") for name in names)
+    assert options["poolclass"] is NullPool
+    assert "pool_size" not in options
+
+
+def test_engine_options_with_statement_cache():
+    """Test a non-zero cache size keeps the pooled engine and asyncpg's statement naming."""
+    options = engine_options(Settings(db_statement_cache_size=100, db_pool_size=7))
+    assert "prepared_statement_name_func" not in options["connect_args"]
+    assert "poolclass" not in options
+    assert options["pool_size"] == 7
@@ -0,0 +1,33 @@
+"""
+Tests for primary key generation.
+"""
+import time
+import uuid
+
+from app import ids
+
+
+def test_uuid7_version_and_variant():
+    """Test generated IDs are RFC 9562 version 7 UUIDs."""
+    value = ids.uuid7()
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_embeds_millisecond_timestamp():
+    """Test the first 48 bits hold the Unix time in milliseconds."""
+    before = time.time_ns() // 1_000_000
+    value = ids.uuid7()
+    after = time.time_ns() // 1_000_000
+    assert before <= value.int >> 80 <= after
+
+
+def test_uuid7_sorts_by_creation_time(monkeypatch):
+    """Test every ID from a later millisecond sorts after the earlier ones."""
+    batches = []
+    for timestamp_ms in (1_700_000_000_000, 1_700_000_000_001, 1_700_000_000_002):
+        monkeypatch.setattr(ids.time, "time_ns", lambda ms=timestamp_ms: ms * 1_000_000)
+        batches.append([ids.uuid7() for _ in range(50)])
+    for earlier, later in zip(batches, batches[1:]):
+        assert max(earlier) < min(later)
+    assert len({value for batch in batches for value in batch}) == 150
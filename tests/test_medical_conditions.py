@@ -0,0 +1,49 @@
+"""
+Tests for Medical Condition endpoints.
+"""
+
+
+def test_read_medical_condition_malformed_id(client):
+    """Test a malformed condition ID is a validation error, not a missing route."""
+    assert client.get("/api/v1/medical-conditions/not-a-uuid").status_code == 422
+
+
+def _walk(client, limit, **params):
+    """Follow next_cursor from the first page to the last and return every page."""
+    pages, cursor = [], None
+    while True:
+        query = {"limit": limit, **params, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/v1/medical-conditions/", params=query)
+        assert response.status_code == 200
+        pages.append(response.json()["items"])
+        cursor = response.json()["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_cursor_pages_cover_every_condition_once(client, medical_condition):
+    """Test one-row pages return each condition exactly once, in order."""
+    everything = [c["medical_condition_id"] for page in _walk(client, 1000) for c in page]
+    pages = _walk(client, 1)
+    assert all(len(page) == 1 for page in pages)
+    assert [page[0]["medical_condition_id"] for page in pages] == everything
+    assert medical_condition["medical_condition_id"] in everything
+
+
+def test_full_last_page_has_no_next_cursor(client, medical_condition):
+    """Test a page that ends exactly at the last row doesn't point to an empty page."""
+    total = sum(len(page) for page in _walk(client, 1000))
+    assert total <= 1000
+    pages = _walk(client, total)
+    assert len(pages) == 1 and len(pages[0]) == total
+
+
+def test_cursor_respects_is_active_filter(client, medical_condition):
+    """Test filtered pages only contain conditions with the requested status."""
+    condition_id = medical_condition["medical_condition_id"]
+    assert client.delete(f"/api/v1/medical-conditions/{condition_id}").status_code == 204
+    active = [c for page in _walk(client, 2, is_active=True) for c in page]
+    inactive = [c for page in _walk(client, 2, is_active=False) for c in page]
+    assert all(c["is_active"] for c in active)
+    assert not any(c["is_active"] for c in inactive)
+    assert condition_id in {c["medical_condition_id"] for c in inactive}
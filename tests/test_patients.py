@@ -3,21 +3,20 @@ Example test file for Patient endpoints.
 This demonstrates the testing structure - full implementation would require
 test database setup and more comprehensive test cases.
 """
-import pytest
-from fastapi.testclient import TestClient
-from app.main import app
+import uuid
+from starlette.requests import Request
 
-client = TestClient(app)
+from app.routes.patients import _etag, _not_modified
 
 
-def test_health_check():
+def test_health_check(client):
     """Test health check endpoint."""
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
 
 
-def test_get_patients_empty():
+def test_get_patients_empty(client):
     """Test getting patients when none exist."""
     response = client.get("/api/v1/patients")
     assert response.status_code == 200
@@ -25,7 +24,7 @@ def test_get_patients_empty():
     assert response.json()["items"] == []
 
 
-def test_create_patient_validation_error():
+def test_create_patient_validation_error(client):
     """Test patient creation with invalid data."""
     response = client.post(
         "/api/v1/patients",
@@ -39,3 +38,130 @@ def test_create_patient_validation_error():
         }
     )
     assert response.status_code == 422
+
+
+def test_read_patient_malformed_id(client):
+    """Test a malformed patient ID is a validation error, not a missing route."""
+    assert client.get("/api/v1/patients/not-a-uuid").status_code == 422
+    assert client.get("/api/v1/patients/not-a-uuid/calls").status_code == 422
+
+
+def _free_person_id(client, create_patient):
+    """Create a patient, delete it, and return the person left behind."""
+    patient = create_patient()
+    assert client.delete(f"/api/v1/patients/{patient['patient_id']}").status_code == 204
+    return patient["person_id"]
+
+
+def test_bulk_create_patients(client, create_patient, medical_condition):
+    """Test bulk creation returns patients in request order."""
+    person_ids = [_free_person_id(client, create_patient) for _ in range(2)]
+    response = client.post(
+        "/api/v1/patients/bulk",
+        json=[
+            {"person_id": person_id, "medical_condition_id": medical_condition["medical_condition_id"]}
+            for person_id in person_ids
+        ]
+    )
+    assert response.status_code == 201
+    assert [p["person_id"] for p in response.json()] == person_ids
+    assert all(p["medical_condition"]["medical_condition_id"] == medical_condition["medical_condition_id"]
+               for p in response.json())
+
+
+def test_bulk_create_patients_is_all_or_nothing(client, create_patient, medical_condition):
+    """Test a duplicate or missing person in the batch creates no patients."""
+    person_id = _free_person_id(client, create_patient)
+    condition_id = medical_condition["medical_condition_id"]
+    
+    duplicate = client.post(
+        "/api/v1/patients/bulk",
+        json=[{"person_id": person_id, "medical_condition_id": condition_id}] * 2
+    )
+    assert duplicate.status_code == 409
+    
+    missing = client.post(
+        "/api/v1/patients/bulk",
+        json=[
+            {"person_id": person_id, "medical_condition_id": condition_id},
+            {"person_id": str(uuid.uuid4()), "medical_condition_id": condition_id}
+        ]
+    )
+    assert missing.status_code == 404
+    
+    created = client.post(
+        "/api/v1/patients/with-person-id",
+        json={"person_id": person_id, "medical_condition_id": condition_id}
+    )
+    assert created.status_code == 201
+
+
+def test_etag_helpers():
+    """Test ETag construction and If-None-Match matching."""
+    def request(if_none_match=None):
+        headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+        return Request({"type": "http", "headers": headers})
+    
+    etag = _etag(1, "a")
+    assert etag.startswith('W/"') and etag == _etag(1, "a")
+    assert etag != _etag(2, "a")
+    assert _not_modified(request(), etag) is None
+    assert _not_modified(request('W/"other"'), etag) is None
+    for header in (etag, f'W/"other", {etag}', "*"):
+        response = _not_modified(request(header), etag)
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+
+def test_read_patient_etag(client, create_patient):
+    """Test a patient read is 304 while unchanged and 200 again after a write."""
+    patient_id = create_patient()["patient_id"]
+    first = client.get(f"/api/v1/patients/{patient_id}")
+    etag = first.headers["etag"]
+    
+    cached = client.get(f"/api/v1/patients/{patient_id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    
+    client.put(f"/api/v1/patients/{patient_id}", json={"status": "inactive"})
+    updated = client.get(f"/api/v1/patients/{patient_id}", headers={"If-None-Match": etag})
+    assert updated.status_code == 200
+    assert updated.json()["status"] == "inactive"
+    
+    client.post("/api/v1/call-history/", json={"patient_id": patient_id})
+    called = client.get(f"/api/v1/patients/{patient_id}", headers={"If-None-Match": updated.headers["etag"]})
+    assert called.status_code == 200
+    assert called.json()["call_count"] == 1
+
+
+def test_read_patients_etag(client, create_patient, medical_condition):
+    """Test a list page is 304 while unchanged and 200 once a patient is added."""
+    params = {"medical_condition_id": medical_condition["medical_condition_id"]}
+    create_patient()
+    etag = client.get("/api/v1/patients/", params=params).headers["etag"]
+    
+    cached = client.get("/api/v1/patients/", params=params, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    
+    create_patient()
+    changed = client.get("/api/v1/patients/", params=params, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["total"] == 2
+
+
+def test_read_patients_summary_fields(client, create_patient, medical_condition):
+    """Test summaries carry the documented fields, including the call counters."""
+    patient = create_patient()
+    response = client.get(
+        "/api/v1/patients/summary",
+        params={"medical_condition_id": medical_condition["medical_condition_id"]}
+    )
+    assert response.status_code == 200
+    assert response.json() == [{
+        "patient_id": patient["patient_id"],
+        "status": "active",
+        "first_contact_date": None,
+        "call_count": 0,
+        "last_call_at": None,
+        "email": patient["person"]["email"]
+    }]